@@ -1,5 +1,5 @@
 from neo4j import GraphDatabase, Driver, DEFAULT_DATABASE
-from typing import Union
+from typing import Union, Iterable
 
 
 def run_query_return_results(connection: Driver, query: str, database: str = None, **params):
@@ -9,3 +9,38 @@ def run_query_return_results(connection: Driver, query: str, database: str = Non
         result = list(s.run(query, **params))
 
     return result
+
+
+def _run_query_in_transaction(tx, query: str, **params):
+    return list(tx.run(query, **params))
+
+
+def run_query_in_batches(connection: Driver, query: str, batches: Iterable[dict], database: str = None):
+    """
+    Run the same write query once for each parameter dictionary in `batches`.
+
+    All batches share one session, each batch is committed in its own managed write transaction
+    (`session.execute_write`). This avoids opening a new session/connection for every batch.
+
+    :param connection: The Neo4j driver.
+    :param query: The Cypher query.
+    :param batches: Iterable of query parameter dictionaries, one per transaction.
+    :param database: Optional database name.
+    """
+    if not database:
+        database = DEFAULT_DATABASE
+    with connection.session(database=database) as s:
+        for params in batches:
+            s.execute_write(_run_query_in_transaction, query, **params)
+
+
+def run_query_return_single_value(connection: Driver, query: str, database: str = None, **params):
+    """
+    Run a query that returns exactly one row (e.g. a `count()`) and return the first value of this row.
+
+    Only the single record is fetched instead of materializing a list of all records.
+    """
+    if not database:
+        database = DEFAULT_DATABASE
+    with connection.session(database=database) as s:
+        return s.run(query, **params).single(strict=True).value()
@@ -1,6 +1,9 @@
 from itertools import chain, islice
+from typing import List
 import logging
 
+from neo4j import DEFAULT_DATABASE
+
 from graphio.graph import run_query_return_results
 
 log = logging.getLogger(__name__)
@@ -21,6 +24,47 @@ def chunks(iterable, size=10):
         yield chain([first], islice(iterator, int(size) - 1))
 
 
+def single_index_query(label, prop) -> str:
+    """
+    Query to create an index on a single property.
+
+    :param label: The label.
+    :param prop: The property.
+    """
+    return f"CREATE INDEX IF NOT EXISTS FOR (n:{label}) ON (n.{prop})"
+
+
+def composite_index_query(label, properties) -> str:
+    """
+    Query to create a composite index on multiple properties.
+
+    :param label: The label.
+    :param properties: The properties.
+    """
+    property_list = []
+    for prop in properties:
+        property_list.append(f"n.{prop}")
+
+    return f"CREATE INDEX IF NOT EXISTS FOR (n:{label}) ON ({','.join(property_list)})"
+
+
+def label_index_queries(labels, properties) -> List[str]:
+    """
+    Queries to create indexes for all label/property combinations as well as a composite index per label
+    if multiple properties are passed.
+
+    :param labels: The labels.
+    :param properties: The properties.
+    """
+    queries = []
+    for label in labels:
+        for prop in properties:
+            queries.append(single_index_query(label, prop))
+        if len(properties) > 1:
+            queries.append(composite_index_query(label, properties))
+    return queries
+
+
 def create_single_index(graph, label, prop, database=None):
     """
     Create an inidex on a single property.
@@ -30,7 +74,7 @@ def create_single_index(graph, label, prop, database=None):
     """
 
     log.debug("Create index {}, {}".format(label, prop))
-    q = f"CREATE INDEX IF NOT EXISTS FOR (n:{label}) ON (n.{prop})"
+    q = single_index_query(label, prop)
     log.debug(q)
     run_query_return_results(graph, q, database=database)
 
@@ -43,10 +87,20 @@ def create_composite_index(graph, label, properties, database=None):
     :param prop: The property.
     """
 
-    property_list = []
-    for prop in properties:
-        property_list.append(f"n.{prop}")
-
-    q = f"CREATE INDEX IF NOT EXISTS FOR (n:{label}) ON ({','.join(property_list)})"
+    q = composite_index_query(label, properties)
     log.debug(q)
     run_query_return_results(graph, q, database=database)
+
+
+def create_indexes(graph, queries: List[str], database=None):
+    """
+    Run a list of index queries in one session.
+
+    :param queries: List of index queries, e.g. from `label_index_queries()`.
+    """
+    if not database:
+        database = DEFAULT_DATABASE
+    with graph.session(database=database) as s:
+        for q in queries:
+            log.debug(q)
+            s.run(q).consume()
@@ -1,10 +1,13 @@
 from collections import namedtuple
 import logging
+import sys
 from typing import Type, Union, List, Optional
 from dataclasses import dataclass
 
-from graphio.objects.nodeset import NodeSet
+from graphio.objects.nodeset import NodeSet, _merge_key_getter
 from graphio.objects.relationshipset import RelationshipSet
+from graphio.queries import nodes_exists_factory
+from graphio.graph import run_query_return_results
 
 log = logging.getLogger(__name__)
 
@@ -40,6 +43,8 @@ class NodeDescriptor:
 
 
 class StringContainer:
+    __slots__ = ('v',)
+
     def __init__(self, v: str = None):
         self.v = v
 
@@ -54,11 +59,15 @@ class StringContainer:
 
 
 class MergeKey(StringContainer):
+    __slots__ = ()
+
     def __init__(self, v: str = None):
         super(MergeKey, self).__init__(v)
 
 
 class Label(StringContainer):
+    __slots__ = ()
+
     def __init__(self, v: str = None):
         super(Label, self).__init__(v)
 
@@ -73,24 +82,29 @@ class MetaNode(type):
                     value.v = key
 
         # add Label(ClassName) if none is given
-        if not cls.__labels__:
+        if not any(isinstance(v, Label) for v in cls.__dict__.values()):
             setattr(cls, cls.__name__, Label(cls.__name__))
 
+        # collect labels and merge keys once when the class is created, interned because they are used as
+        # dictionary keys for every instance
+        cls._labels = tuple(sys.intern(str(v)) for v in cls.__dict__.values() if isinstance(v, Label))
+        cls._merge_keys = tuple(sys.intern(str(v)) for v in cls.__dict__.values() if isinstance(v, MergeKey))
+
+        # merge keys as frozenset for fast lookup on instances
+        cls._merge_keys_set = frozenset(cls._merge_keys)
+        # returns the tuple of merge key values from a properties dict
+        cls._merge_key_getter = staticmethod(_merge_key_getter(cls._merge_keys))
+
+        # queries only depend on labels/merge keys, build them once per class
+        cls._exists_query = nodes_exists_factory(cls._labels, cls._merge_keys)
+
     @property
     def __merge_keys__(cls):
-        merge_keys = []
-        for v in cls.__dict__.values():
-            if isinstance(v, MergeKey):
-                merge_keys.append(str(v))
-        return merge_keys
+        return list(cls._merge_keys)
 
     @property
     def __labels__(cls):
-        labels = []
-        for v in cls.__dict__.values():
-            if isinstance(v, Label):
-                labels.append(str(v))
-        return labels
+        return list(cls._labels)
 
     def __getattribute__(cls, item):
         value = super(MetaNode, cls).__getattribute__(item)
@@ -104,12 +118,14 @@ class MetaNode(type):
 class ModelNode(metaclass=MetaNode):
     """
     Baseclass for model objects.
+
+    Instances only store their `properties`. Subclasses can set `__slots__ = ()` to avoid a per-instance
+    `__dict__` when many instances are created.
     """
+    __slots__ = ('properties',)
 
     def __init__(self, *args, **kwargs):
-        self.properties = {}
-        for k, v in kwargs.items():
-            self.properties[k] = v
+        self.properties = dict(kwargs)
 
     @classmethod
     def dataset(cls) -> NodeSet:
@@ -149,13 +165,44 @@ class ModelNode(metaclass=MetaNode):
         :return: Dictionary with the merge properties for this node.
         :rtype: dict
         """
-        merge_props = {}
-        for k in self.__class__.__merge_keys__:
-            try:
-                merge_props[k] = self.properties[k]
-            except KeyError:
-                raise TypeError("Trying to merge node where values for merge_keys are not defined.")
-        return merge_props
+        if not self._merge_keys_set <= self.properties.keys():
+            raise TypeError("Trying to merge node where values for merge_keys are not defined.")
+        return dict(zip(self._merge_keys, self._merge_key_getter(self.properties)))
+
+    @classmethod
+    def exists_many(cls, graph, instances: List['ModelNode'], database: str = None) -> List[bool]:
+        """
+        Check for a list of instances if the corresponding nodes exist in the graph. All instances are checked
+        with one query.
+
+        :param graph: The Neo4j driver.
+        :param instances: List of instances of this ModelNode.
+        :param database: Optional database name.
+        :return: List of True/False values in the order of `instances`.
+        """
+        # build (and validate) the merge properties before the query is sent
+        rows = [i.merge_props for i in instances]
+        if not rows:
+            return []
+
+        result = run_query_return_results(graph, cls._exists_query, database=database, rows=rows)
+
+        exists = [False] * len(rows)
+        for row in result:
+            if row['c'] > 1:
+                raise TypeError("Found more than one node with the merge properties of this node.")
+            exists[row['i']] = row['c'] == 1
+        return exists
+
+    def exists(self, graph, database: str = None) -> bool:
+        """
+        Check if the node exists in the graph.
+
+        :param graph: The Neo4j driver.
+        :param database: Optional database name.
+        :return: True if the node exists.
+        """
+        return self.exists_many(graph, [self], database=database)[0]
 
     @property
     def additional_props(self) -> dict:
@@ -165,11 +212,7 @@ class ModelNode(metaclass=MetaNode):
         :return: Dictionary with all properties except the merge properties.
         :rtype: dict
         """
-        additional_props = {}
-        for k, v in self.properties.items():
-            if k not in self.__class__.__merge_keys__:
-                additional_props[k] = v
-        return additional_props
+        return {k: v for k, v in self.properties.items() if k not in self._merge_keys_set}
 
 
 class ModelRelationship:
@@ -191,6 +234,8 @@ class ModelRelationship:
           type = 'LIKES'
 
     """
+    __slots__ = ('source_node', 'target_node', 'properties')
+
     source = None
     target = None
     type = ''
@@ -198,10 +243,7 @@ class ModelRelationship:
     def __init__(self, source: 'ModelNode', target: 'ModelNode', **kwargs):
         self.source_node = source
         self.target_node = target
-        self.properties = {}
-        for k, v in kwargs.items():
-            self.properties[k] = v
-
+        self.properties = dict(kwargs)
 
     @classmethod
     def dataset(cls) -> RelationshipSet:
@@ -16,8 +16,7 @@ class Container:
 
         # add objects if they are passed
         if objects:
-            for o in objects:
-                self.objects.append(o)
+            self.add_all(objects)
 
     @property
     def nodesets(self):
@@ -34,8 +33,14 @@ class Container:
         return get_instances_from_list(self.objects, RelationshipSet)
 
     def get_nodeset(self, labels, merge_keys):
+        """
+        Get the first NodeSet with the given labels and merge keys (order does not matter).
+
+        :return: The NodeSet or None.
+        """
+        key = _nodeset_key(labels, merge_keys)
         for nodeset in self.nodesets:
-            if set(nodeset.labels) == set(labels) and set(nodeset.merge_keys) == set(merge_keys):
+            if _nodeset_key(nodeset.labels, nodeset.merge_keys) == key:
                 return nodeset
 
     def add(self, object):
@@ -45,16 +50,28 @@ class Container:
         for o in objects:
             self.add(o)
 
-    def merge_nodesets(self):
+    def merge_nodesets(self, graph, database: str = None):
         """
         Merge all node sets if merge_key is defined.
+
+        Each NodeSet is written with batched `UNWIND` queries, i.e. one query per batch and not one per node.
         """
         for nodeset in self.nodesets:
-            nodeset.merge(nodeset.merge_keys)
+            nodeset.merge(graph, database=database)
 
-    def create_relationshipsets(self):
+    def create_relationshipsets(self, graph, database: str = None):
+        """
+        Create all relationship sets.
+
+        Each RelationshipSet is written with batched `UNWIND` queries, i.e. one query per batch and not one
+        per relationship. Call this after the nodes are in the graph.
+        """
         for relationshipset in self.relationshipsets:
-            relationshipset.create()
+            relationshipset.create(graph, database=database)
+
+
+def _nodeset_key(labels, merge_keys) -> tuple:
+    return frozenset(labels), frozenset(merge_keys)
 
 
 def get_instances_from_list(list, klass):
@@ -5,14 +5,15 @@ import json
 import csv
 import gzip
 from collections import defaultdict
+from operator import itemgetter
 from typing import Set, List, Union
 
 from pydantic import BaseModel
 
-from graphio.helper import chunks, create_single_index, create_composite_index
+from graphio.helper import chunks, create_indexes, label_index_queries
 from graphio import defaults
 from graphio.queries import nodes_merge_factory, nodes_create_factory
-from graphio.graph import run_query_return_results
+from graphio.graph import run_query_in_batches
 
 log = logging.getLogger(__name__)
 
@@ -24,6 +25,20 @@ TYPE_CONVERSION = {'int': int,
                    'float': float}
 
 
+def _merge_key_getter(merge_keys: List[str]):
+    """
+    Return a function that returns the tuple of merge key values for a node dict.
+
+    :param merge_keys: The merge keys.
+    """
+    if not merge_keys:
+        return lambda node_dict: ()
+    if len(merge_keys) == 1:
+        getter = itemgetter(merge_keys[0])
+        return lambda node_dict: (getter(node_dict),)
+    return itemgetter(*merge_keys)
+
+
 class NodeSetDefinition(BaseModel):
     """
     NodeSetDefinition is a NodeSet without the actual data. Independent class for now, can be parent
@@ -82,6 +97,8 @@ class NodeSet:
         else:
             self.batch_size = defaults.BATCHSIZE
 
+        self._merge_key_getter = _merge_key_getter(self.merge_keys)
+
         self.nodes = []
         # a node index with merge_key_id -> [positions in nodes list]
         # this works for both unique and non-unique settings
@@ -103,7 +120,7 @@ class NodeSet:
         :param node_dict: A node dict.
         :return:
         """
-        return tuple([node_dict[key] for key in self.merge_keys])
+        return self._merge_key_getter(node_dict)
 
     def add_node(self, properties):
         """
@@ -157,10 +174,10 @@ class NodeSet:
         :type properties: dict
         """
 
-        compare_values = frozenset([properties[key] for key in self.merge_keys])
+        compare_values = frozenset(properties[key] for key in self.merge_keys)
 
-        for other_node_properties in self.node_properties():
-            this_values = frozenset([other_node_properties[key] for key in self.merge_keys])
+        for other_node_properties in self.nodes:
+            this_values = frozenset(other_node_properties[key] for key in self.merge_keys)
             if this_values == compare_values:
                 return None
 
@@ -390,17 +407,23 @@ class NodeSet:
 
         q = nodes_create_factory(self.labels, property_parameter="props", additional_labels=self.additional_labels, source=self.source)
 
-        for batch in chunks(self.nodes, size=batch_size):
-            run_query_return_results(graph, q, database=database, props=list(batch), source=self.uuid)
+        run_query_in_batches(graph, q,
+                             ({'props': list(batch), 'source': self.uuid}
+                              for batch in chunks(self.nodes, size=batch_size)),
+                             database=database)
 
-    def merge(self, graph, merge_properties=None, batch_size=None, preserve=None, append_props=None, database=None):
+    def merge(self, graph, merge_properties=None, batch_size=None, preserve=None, append_props=None, database=None,
+              ensure_index: bool = False):
         """
         Merge nodes from NodeSet on merge properties.
 
         :param merge_properties: The merge properties.
+        :param ensure_index: Create the indexes for labels/merge keys (if they do not exist) before merging.
         """
         if not self.labels:
             log.warning("MERGing without labels will not use an index and is slow.")
+        elif ensure_index:
+            self.create_index(graph, database=database)
         # overwrite if preserve is passed
         if preserve:
             self.preserve = preserve
@@ -419,11 +442,25 @@ class NodeSet:
         log.debug('Batch Size: {}'.format(batch_size))
 
         q = nodes_merge_factory(self.labels, self.merge_keys, array_props=self.append_props, preserve=self.preserve,
-                                property_parameter='props', additional_labels=self.additional_labels, source=self.source)
+                                property_parameter='props', additional_labels=self.additional_labels, source=self.source,
+                                with_set=not self._only_merge_key_properties())
+
+        run_query_in_batches(graph, q,
+                             ({'props': list(batch), 'append_props': self.append_props, 'preserve': self.preserve,
+                               'source': self.uuid}
+                              for batch in chunks(self.nodes, size=batch_size)),
+                             database=database)
 
-        for batch in chunks(self.node_properties(), size=batch_size):
-            run_query_return_results(graph, q, database=database, props=list(batch), append_props=self.append_props,
-                                     preserve=self.preserve, source=self.uuid)
+    def _only_merge_key_properties(self) -> bool:
+        """
+        Check if the nodes in this NodeSet do not have any properties other than the merge keys.
+
+        Nodes that are yielded from a file are not checked because this would consume the generator.
+        """
+        if not isinstance(self.nodes, list):
+            return False
+        merge_keys = set(self.merge_keys)
+        return all(node.keys() <= merge_keys for node in self.nodes)
 
     def node_properties(self):
         """
@@ -441,9 +478,8 @@ class NodeSet:
         all_props = set()
 
         # collect properties
-        for props in self.node_properties():
-            for k in props:
-                all_props.add(k)
+        for props in self.nodes:
+            all_props.update(props.keys())
 
         return all_props
 
@@ -482,14 +518,7 @@ class NodeSet:
         Create indices for all label/merge ky combinations as well as a composite index if multiple merge keys exist.
         """
         if self.merge_keys:
-            for label in self.labels:
-                # create individual indexes
-                for prop in self.merge_keys:
-                    create_single_index(graph, label, prop, database)
-
-                # composite indexes
-                if len(self.merge_keys) > 1:
-                    create_composite_index(graph, label, self.merge_keys, database)
+            create_indexes(graph, label_index_queries(self.labels, self.merge_keys), database=database)
 
 
 def _read_nodes(csv_filepath, property_map, type_conversion=None):
@@ -9,9 +9,9 @@ import gzip
 from pydantic import BaseModel, Field
 
 from graphio import defaults
-from graphio.helper import chunks, create_single_index, create_composite_index
+from graphio.helper import chunks, create_indexes, label_index_queries
 from graphio.queries import rels_create_factory, rels_merge_factory, rels_params_from_objects
-from graphio.graph import run_query_return_results
+from graphio.graph import run_query_in_batches
 
 log = logging.getLogger(__name__)
 
@@ -110,8 +110,8 @@ class RelationshipSet:
         self.combined = '{0}_{1}_{2}_{3}_{4}'.format(self.rel_type,
                                                      '_'.join(sorted(self.start_node_labels)),
                                                      '_'.join(sorted(self.end_node_labels)),
-                                                     '_'.join(sorted([str(x) for x in self.start_node_properties])),
-                                                     '_'.join(sorted([str(x) for x in self.end_node_properties]))
+                                                     '_'.join(sorted(str(x) for x in self.start_node_properties)),
+                                                     '_'.join(sorted(str(x) for x in self.end_node_properties))
                                                      )
 
         if batch_size:
@@ -494,9 +494,10 @@ class RelationshipSet:
         # iterate over chunks of rels
         q = rels_create_factory(self.start_node_labels, self.end_node_labels, self.start_node_properties,
                                 self.end_node_properties, self.rel_type, source=self.source)
-        for batch in chunks(self.relationships, size=batch_size):
-            query_parameters = rels_params_from_objects(batch)
-            run_query_return_results(graph, q, database=database, source=self.uuid, **query_parameters)
+        run_query_in_batches(graph, q,
+                             ({'source': self.uuid, **rels_params_from_objects(batch)}
+                              for batch in chunks(self.relationships, size=batch_size)),
+                             database=database)
 
     def merge(self, graph, database=None, batch_size=None):
         """
@@ -510,9 +511,10 @@ class RelationshipSet:
         # iterate over chunks of rels
         q = rels_merge_factory(self.start_node_labels, self.end_node_labels, self.start_node_properties,
                                self.end_node_properties, self.rel_type, source=self.source)
-        for batch in chunks(self.relationships, size=batch_size):
-            query_parameters = rels_params_from_objects(batch)
-            run_query_return_results(graph, q, database=database, source=self.uuid, **query_parameters)
+        run_query_in_batches(graph, q,
+                             ({'source': self.uuid, **rels_params_from_objects(batch)}
+                              for batch in chunks(self.relationships, size=batch_size)),
+                             database=database)
 
     def create_index(self, graph, database=None):
         """
@@ -520,23 +522,9 @@ class RelationshipSet:
         node property is defined, all single property indices as well as the composite index are created.
         """
 
-        # from start nodes
-        for label in self.start_node_labels:
-            # create individual indexes
-            for prop in self.start_node_properties:
-                create_single_index(graph, label, prop, database=database)
-
-            # composite indexes
-            if len(self.start_node_properties) > 1:
-                create_composite_index(graph, label, self.start_node_properties, database=database)
-
-        for label in self.end_node_labels:
-            for prop in self.end_node_properties:
-                create_single_index(graph, label, prop, database=database)
-
-            # composite indexes
-            if len(self.end_node_properties) > 1:
-                create_composite_index(graph, label, self.end_node_properties, database=database)
+        queries = label_index_queries(self.start_node_labels, self.start_node_properties)
+        queries += label_index_queries(self.end_node_labels, self.end_node_properties)
+        create_indexes(graph, queries, database=database)
 
 
 def _read_rels(csv_filepath, start_node_properties, end_node_properties, start_key_to_header, end_key_to_header,
@@ -3,9 +3,9 @@ from typing import List
 from pydantic import BaseModel
 from neo4j import Driver, Transaction
 
-from graphio.queries import CypherQuery
-from graphio.helper import chunks, create_single_index, create_composite_index
-from graphio.queries import merge_clause_with_properties
+from graphio.queries import CypherQuery, merge_clause_with_properties, nodes_create_dynamic_labels_factory, \
+    nodes_merge_dynamic_labels_factory
+from graphio.helper import chunks, create_indexes, label_index_queries
 from graphio.objects.nodeset import NodeSet
 
 
@@ -40,12 +40,10 @@ class UnstructuredNodeSet(BaseModel):
         return unique_nodes
 
     def create_index(self, driver: Driver, database: str = None):
+        queries = []
         for labels, merge_keys, _ in self.unique_node_definitions:
-            for label in labels:
-                for merge_key in merge_keys:
-                    create_single_index(driver, label, merge_key, database=database)
-                if len(merge_keys) > 1:
-                    create_composite_index(driver, label, merge_keys, database=database)
+            queries += label_index_queries(labels, merge_keys)
+        create_indexes(driver, queries, database=database)
 
     @staticmethod
     def create_nodes(tx, nodes: List[Node]):
@@ -57,16 +55,39 @@ class UnstructuredNodeSet(BaseModel):
 
             tx.run(q.query(), properties=node.properties)
 
-    def create(self, driver: Driver, database: str = None, batch_size=None):
+    @staticmethod
+    def create_nodes_dynamic(tx, nodes: List[Node]):
+        """
+        Create nodes with `apoc.create.node()`. Labels are passed as parameters, all nodes of a chunk are
+        created with the same query. Requires APOC.
+        """
+        params = [
+            {'labels': node.labels + node.additional_labels, 'properties': node.properties}
+            for node in nodes
+        ]
+        tx.run(nodes_create_dynamic_labels_factory(), nodes=params)
+
+    def create(self, driver: Driver, database: str = None, batch_size=None, dynamic: bool = False):
         """
         Create all nodes in the set.
+
+        By default one :code:`CREATE` query is built per node with the labels in the query text. Pass
+        `dynamic=True` to create each chunk with one `apoc.create.node()` query that takes the labels as
+        parameters. Neo4j then caches a single plan for all label combinations. This requires APOC.
+
+        :param driver: The Neo4j driver.
+        :param database: Optional database name.
+        :param batch_size: Batch size, default is 1000.
+        :param dynamic: Use the parameterized APOC query (requires APOC).
         """
         if not batch_size:
             batch_size = 1000
 
+        create_nodes = self.create_nodes_dynamic if dynamic else self.create_nodes
+
         with driver.session(database=database) as session:
             for chunk in chunks(self.nodes, batch_size):
-                session.execute_write(self.create_nodes, chunk)
+                session.execute_write(create_nodes, chunk)
 
     def merge_nodes(self, tx, nodes: List[Node]):
         for node in nodes:
@@ -78,16 +99,49 @@ class UnstructuredNodeSet(BaseModel):
                 q.append(f"SET n:{':'.join(node.additional_labels)}")
             tx.run(q.query(), properties=node.properties)
 
-    def merge(self, driver: Driver, database: str = None, batch_size=None):
+    def merge_nodes_dynamic(self, tx, nodes: List[Node]):
+        """
+        Merge nodes with `apoc.merge.node()`. Labels and merge properties are passed as parameters, all nodes
+        of a chunk are merged with the same query. Requires APOC.
+
+        `apoc.merge.node()` needs at least one merge property, nodes without merge keys are merged with
+        :meth:`merge_nodes`.
+        """
+        nodes_without_merge_keys = [node for node in nodes if not node.merge_keys]
+        if nodes_without_merge_keys:
+            self.merge_nodes(tx, nodes_without_merge_keys)
+
+        params = [
+            {'labels': node.labels,
+             'merge_properties': {k: node.properties.get(k) for k in node.merge_keys},
+             'properties': node.properties,
+             'additional_labels': node.additional_labels}
+            for node in nodes if node.merge_keys
+        ]
+        if params:
+            tx.run(nodes_merge_dynamic_labels_factory(), nodes=params)
+
+    def merge(self, driver: Driver, database: str = None, batch_size=None, dynamic: bool = False):
         """
         Merge all nodes in the set.
+
+        By default one :code:`MERGE` query is built per node with the labels in the query text. Pass
+        `dynamic=True` to merge each chunk with one `apoc.merge.node()` query that takes the labels as
+        parameters. Neo4j then caches a single plan for all label combinations. This requires APOC.
+
+        :param driver: The Neo4j driver.
+        :param database: Optional database name.
+        :param batch_size: Batch size, default is 1000.
+        :param dynamic: Use the parameterized APOC query (requires APOC).
         """
         if not batch_size:
             batch_size = 1000
 
+        merge_nodes = self.merge_nodes_dynamic if dynamic else self.merge_nodes
+
         with driver.session(database=database) as session:
             for chunk in chunks(self.nodes, batch_size):
-                session.execute_write(self.merge_nodes, chunk)
+                session.execute_write(merge_nodes, chunk)
 
     def nodesets(self):
         """
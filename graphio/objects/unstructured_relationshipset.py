@@ -1,11 +1,12 @@
 from typing import List
+from collections import defaultdict
 
 from pydantic import BaseModel
 from neo4j import Driver, Transaction
 
 from graphio.queries import CypherQuery
-from graphio.helper import chunks, create_single_index, create_composite_index
-from graphio.queries import merge_clause_with_properties
+from graphio.helper import chunks, create_indexes, label_index_queries
+from graphio.queries import rels_create_factory, rels_match_clauses, rels_params_from_objects
 from graphio.objects.relationshipset import RelationshipSet
 
 
@@ -57,10 +58,7 @@ class UnstructuredRelationshipSet(BaseModel):
         unique_relationships = set()
 
         for relationship in self.relationships:
-            relationship_def = (
-                relationship.type, tuple(relationship.start_node.labels), tuple(relationship.end_node.labels),
-                tuple(relationship.start_node.properties.keys()), tuple(relationship.end_node.properties.keys())
-            )
+            relationship_def = self.relationship_definition(relationship)
 
             if relationship_def not in unique_relationships:
                 unique_relationships.add(relationship_def)
@@ -68,36 +66,43 @@ class UnstructuredRelationshipSet(BaseModel):
         return unique_relationships
 
     def create_index(self, driver: Driver, database: str = None):
+        queries = []
         for labels, merge_keys in self.unique_node_definitions:
-            for label in labels:
-                for merge_key in merge_keys:
-                    create_single_index(driver, label, merge_key, database=database)
-                if len(merge_keys) > 1:
-                    create_composite_index(driver, label, merge_keys, database=database)
+            queries += label_index_queries(labels, merge_keys)
+        create_indexes(driver, queries, database=database)
 
     @staticmethod
-    def create_relationships(tx, relationships: List[Relationship]):
-        for relationship in relationships:
+    def relationship_definition(relationship: Relationship) -> tuple:
+        """
+        Return the relationship type/start node/end node combination of a relationship.
+        """
+        return (
+            relationship.type, tuple(relationship.start_node.labels), tuple(relationship.end_node.labels),
+            tuple(relationship.start_node.properties.keys()), tuple(relationship.end_node.properties.keys())
+        )
 
-            q = CypherQuery(
-                f"MATCH (a:{':'.join(relationship.start_node.labels)}), (b:{':'.join(relationship.end_node.labels)})"
+    @staticmethod
+    def group_relationships(relationships: List[Relationship]) -> dict:
+        """
+        Group relationships by their relationship definition. Returns a dictionary with the definition as key
+        and the query parameters for `rels_create_factory`/`rels_merge_factory` as value.
+        """
+        grouped = defaultdict(list)
+        for relationship in relationships:
+            grouped[UnstructuredRelationshipSet.relationship_definition(relationship)].append(
+                (relationship.start_node.properties, relationship.end_node.properties, relationship.properties)
             )
+        return {reldef: rels_params_from_objects(rels) for reldef, rels in grouped.items()}
 
-            # collect WHERE clauses
-            where_clauses = []
-            for property in relationship.start_node.properties.keys():
-                where_clauses.append(f'a.{property} = $start_node_properties.{property}')
-            for property in relationship.end_node.properties.keys():
-                where_clauses.append(f'b.{property} = $end_node_properties.{property}')
-
-            q.append("WHERE " + ' AND '.join(where_clauses))
+    @staticmethod
+    def create_relationships(tx, relationships: List[Relationship]):
+        for reldef, params in UnstructuredRelationshipSet.group_relationships(relationships).items():
+            rel_type, start_node_labels, end_node_labels, start_node_properties, end_node_properties = reldef
 
-            q.append(f"CREATE (a)-[r:{relationship.type}]->(b)")
-            q.append("SET r = $relationship_properties RETURN count(r)")
+            q = rels_create_factory(list(start_node_labels), list(end_node_labels), start_node_properties,
+                                    end_node_properties, rel_type)
 
-            tx.run(q.query(), start_node_properties=relationship.start_node.properties,
-                   end_node_properties=relationship.end_node.properties,
-                   relationship_properties=relationship.properties)
+            tx.run(q, **params)
 
     def create(self, driver: Driver, database: str = None, batch_size=None):
         """
@@ -112,27 +117,17 @@ class UnstructuredRelationshipSet(BaseModel):
 
     @staticmethod
     def merge_relationships(tx, relationships: List[Relationship]):
-        for relationship in relationships:
+        for reldef, params in UnstructuredRelationshipSet.group_relationships(relationships).items():
+            rel_type, start_node_labels, end_node_labels, start_node_properties, end_node_properties = reldef
 
-            q = CypherQuery(
-                f"MATCH (a:{':'.join(relationship.start_node.labels)}), (b:{':'.join(relationship.end_node.labels)})"
-            )
+            q = CypherQuery("UNWIND $rels AS rel")
+            for clause in rels_match_clauses(list(start_node_labels), list(end_node_labels), start_node_properties,
+                                             end_node_properties):
+                q.append(clause)
+            q.append(f"MERGE (a)-[r:{rel_type}]->(b)")
+            q.append("SET r = rel.properties")
 
-            # collect WHERE clauses
-            where_clauses = []
-            for property in relationship.start_node.properties.keys():
-                where_clauses.append(f'a.{property} = $start_node_properties.{property}')
-            for property in relationship.end_node.properties.keys():
-                where_clauses.append(f'b.{property} = $end_node_properties.{property}')
-
-            q.append("WHERE " + ' AND '.join(where_clauses))
-
-            q.append(f"MERGE (a)-[r:{relationship.type}]->(b)")
-            q.append("SET r = $relationship_properties RETURN count(r)")
-
-            tx.run(q.query(), start_node_properties=relationship.start_node.properties,
-                   end_node_properties=relationship.end_node.properties,
-                   relationship_properties=relationship.properties)
+            tx.run(q.query(), **params)
 
     def merge(self, driver: Driver, database: str = None, batch_size=None):
         """
@@ -153,10 +148,7 @@ class UnstructuredRelationshipSet(BaseModel):
             reldef_to_relationships[reldef] = rs
         # add relationships to the correct RelationshipSet
         for relationship in self.relationships:
-            reldef = (
-                relationship.type, tuple(relationship.start_node.labels), tuple(relationship.end_node.labels),
-                tuple(relationship.start_node.properties.keys()), tuple(relationship.end_node.properties.keys())
-            )
+            reldef = self.relationship_definition(relationship)
             reldef_to_relationships[reldef].add_relationship(relationship.start_node.properties, relationship.end_node.properties, relationship.properties)
 
         return list(reldef_to_relationships.values())
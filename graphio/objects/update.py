@@ -63,26 +63,24 @@ class GraphUpdate(BaseModel):
         self.nodesets.append(nodeset)
 
         with self.driver.session(database=self.database) as session:
-            # merge the nodeset
-            q = "MERGE (ns:NodeSet {uuid: $uuid}) SET ns += $properties"
-            session.run(q, uuid=nodeset.uuid, properties=nodeset.props())
-
-            # create the relationship between the nodeset and the graphupdate
-            q = "MATCH (ns:NodeSet {uuid: $nodeset_uuid}), (gu:GraphUpdate {uuid: $graphupdate_uuid}) MERGE (gu)-[:CONTAINS]->(ns)"
-            session.run(q, nodeset_uuid=nodeset.uuid, graphupdate_uuid=self.uuid)
+            # merge the nodeset and create the relationship between the nodeset and the graphupdate
+            q = """MERGE (ns:NodeSet {uuid: $uuid}) SET ns += $properties
+            WITH ns
+            MATCH (gu:GraphUpdate {uuid: $graphupdate_uuid})
+            MERGE (gu)-[:CONTAINS]->(ns)"""
+            session.run(q, uuid=nodeset.uuid, properties=nodeset.props(), graphupdate_uuid=self.uuid)
 
     def add_relationshipset(self, relationshipset: RelationshipSetDefinition):
         """Add a RelationshipSet that was created outside of the GraphUpdate object."""
         self.relationshipsets.append(relationshipset)
 
         with self.driver.session(database=self.database) as session:
-            # merge the relationshipset
-            q = "MERGE (rs:RelationshipSet {uuid: $uuid}) SET rs += $properties"
-            session.run(q, uuid=relationshipset.uuid, properties=relationshipset.props())
-
-            # create the relationship between the relationshipset and the graphupdate
-            q = "MATCH (rs:RelationshipSet {uuid: $relationshipset_uuid}), (gu:GraphUpdate {uuid: $graphupdate_uuid}) MERGE (gu)-[:CONTAINS]->(rs)"
-            session.run(q, relationshipset_uuid=relationshipset.uuid, graphupdate_uuid=self.uuid)
+            # merge the relationshipset and create the relationship between the relationshipset and the graphupdate
+            q = """MERGE (rs:RelationshipSet {uuid: $uuid}) SET rs += $properties
+            WITH rs
+            MATCH (gu:GraphUpdate {uuid: $graphupdate_uuid})
+            MERGE (gu)-[:CONTAINS]->(rs)"""
+            session.run(q, uuid=relationshipset.uuid, properties=relationshipset.props(), graphupdate_uuid=self.uuid)
 
     def finish(self):
         self.finish_time = datetime.utcnow()
@@ -101,9 +101,13 @@ def nodes_create_factory(labels, property_parameter=None, additional_labels=None
 
 
 def nodes_merge_factory(labels, merge_properties, array_props=None, preserve=None, property_parameter=None,
-                        additional_labels=None, source=False):
+                        additional_labels=None, source=False, with_set=True):
     """
     Generate a :code:`MERGE` query based on the combination of paremeters.
+
+    Pass `with_set=False` if the nodes have no properties other than the merge properties. The
+    `ON CREATE SET`/`ON MATCH SET` clauses are skipped in this case because the `MERGE` already
+    sets all properties.
     """
     if not array_props:
         array_props = []
@@ -132,7 +136,9 @@ def nodes_merge_factory(labels, merge_properties, array_props=None, preserve=Non
     q.append(merge_clause_with_properties(labels, merge_properties))
 
     # handle different ON CREATE SET and ON MATCH SET cases
-    if not array_props and not preserve:
+    if not array_props and not preserve and not with_set:
+        pass
+    elif not array_props and not preserve:
         q.append("ON CREATE SET n = properties")
         q.append("ON MATCH SET n += properties")
     elif not array_props and preserve:
@@ -161,6 +167,83 @@ def nodes_merge_factory(labels, merge_properties, array_props=None, preserve=Non
     return q.query()
 
 
+def nodes_create_dynamic_labels_factory(property_parameter=None):
+    """
+    Generate a :code:`CREATE` query that takes the labels from the parameters. The query text is the same
+    for all label combinations, so Neo4j caches one plan. Requires APOC.
+
+    UNWIND $nodes AS row
+    CALL apoc.create.node(row.labels, row.properties) YIELD node
+    RETURN count(node)
+
+    :param property_parameter: Optional name of the parameter used in the query. Default is 'nodes'.
+    :return: Query
+    """
+    if not property_parameter:
+        property_parameter = 'nodes'
+
+    q = CypherQuery(f"UNWIND ${property_parameter} AS row",
+                    "CALL apoc.create.node(row.labels, row.properties) YIELD node",
+                    "RETURN count(node)")
+    return q.query()
+
+
+def nodes_merge_dynamic_labels_factory(property_parameter=None):
+    """
+    Generate a :code:`MERGE` query that takes labels, merge properties and additional labels from the
+    parameters. The query text is the same for all label combinations, so Neo4j caches one plan. Requires APOC.
+
+    UNWIND $nodes AS row
+    CALL apoc.merge.node(row.labels, row.merge_properties) YIELD node
+    SET node = row.properties
+    WITH node, row
+    CALL apoc.create.addLabels(node, row.additional_labels) YIELD node AS n
+    RETURN count(n)
+
+    :param property_parameter: Optional name of the parameter used in the query. Default is 'nodes'.
+    :return: Query
+    """
+    if not property_parameter:
+        property_parameter = 'nodes'
+
+    q = CypherQuery(f"UNWIND ${property_parameter} AS row",
+                    "CALL apoc.merge.node(row.labels, row.merge_properties) YIELD node",
+                    "SET node = row.properties",
+                    "WITH node, row",
+                    "CALL apoc.create.addLabels(node, row.additional_labels) YIELD node AS n",
+                    "RETURN count(n)")
+    return q.query()
+
+
+def nodes_exists_factory(labels, merge_properties, property_parameter=None):
+    """
+    Count the nodes matching each set of merge properties.
+
+    UNWIND range(0, size($rows) - 1) AS i
+    WITH i, $rows[i] AS r
+    OPTIONAL MATCH (n:Person { name: r.name } )
+    RETURN i, count(n) AS c
+
+    The count is grouped by the row index `i`, not by the row itself. Equal rows stay separate and the
+    result can be mapped back to the input by position.
+
+    :param labels: Labels of the nodes.
+    :param merge_properties: The merge properties.
+    :param property_parameter: Optional name of the parameter used in the query. Default is 'rows'.
+    :return: Query
+    """
+    if not property_parameter:
+        property_parameter = 'rows'
+
+    label_string = get_label_string_from_list_of_labels(labels)
+
+    q = CypherQuery(f"UNWIND range(0, size(${property_parameter}) - 1) AS i",
+                    f"WITH i, ${property_parameter}[i] AS r",
+                    f"OPTIONAL MATCH (n{label_string} {{ {match_properties_as_string(merge_properties, 'r')} }} )",
+                    "RETURN i, count(n) AS c")
+    return q.query()
+
+
 def rels_params_from_objects(relationships, property_identifier=None):
     """
     Format Relationship properties into a one level dictionary matching the query generated in
@@ -182,20 +265,50 @@ def rels_params_from_objects(relationships, property_identifier=None):
     if not property_identifier:
         property_identifier = 'rels'
 
-    output = []
-
-    for r in relationships:
-        d = {}
-        for k, v in r[0].items():
-            d['start_{}'.format(k)] = v
-        for k, v in r[1].items():
-            d['end_{}'.format(k)] = v
-        d['properties'] = r[2]
-        output.append(d)
+    output = [
+        {**{f'start_{k}': v for k, v in start_node_properties.items()},
+         **{f'end_{k}': v for k, v in end_node_properties.items()},
+         'properties': properties}
+        for start_node_properties, end_node_properties, properties in relationships
+    ]
 
     return {property_identifier: output}
 
 
+def rels_match_clauses(start_node_labels, end_node_labels, start_node_properties, end_node_properties) -> List[str]:
+    """
+    MATCH and WHERE clauses to find start node `a` and end node `b` of a relationship from the UNWIND
+    variable `rel`.
+
+    MATCH (a:Gene), (b:GeneSymbol)
+    WHERE a.sid = rel.start_sid AND b.sid = rel.end_sid
+
+    :param start_node_labels: Labels of the start node.
+    :param end_node_labels: Labels of the end node.
+    :param start_node_properties: Property keys to identify the start node.
+    :param end_node_properties: Property keys to identify the end node.
+    :return: List with the MATCH and the WHERE clause.
+    """
+    start_node_label_string = get_label_string_from_list_of_labels(start_node_labels)
+    end_node_label_string = get_label_string_from_list_of_labels(end_node_labels)
+
+    # collect WHERE clauses
+    where_clauses = []
+    for property in start_node_properties:
+        if isinstance(property, ArrayProperty):
+            where_clauses.append(f'rel.start_{property} IN a.{property}')
+        else:
+            where_clauses.append('a.{0} = rel.start_{0}'.format(property))
+    for property in end_node_properties:
+        if isinstance(property, ArrayProperty):
+            where_clauses.append(f'rel.end_{property} IN b.{property}')
+        else:
+            where_clauses.append('b.{0} = rel.end_{0}'.format(property))
+
+    return [f"MATCH (a{start_node_label_string}), (b{end_node_label_string})",
+            "WHERE " + ' AND '.join(where_clauses)]
+
+
 def rels_create_factory(start_node_labels, end_node_labels, start_node_properties,
                         end_node_properties, rel_type, property_identifier=None, source=False):
     """
@@ -221,27 +334,11 @@ def rels_create_factory(start_node_labels, end_node_labels, start_node_propertie
     if not property_identifier:
         property_identifier = 'rels'
 
-    start_node_label_string = get_label_string_from_list_of_labels(start_node_labels)
-    end_node_label_string = get_label_string_from_list_of_labels(end_node_labels)
-
     q = CypherQuery()
     q.append(f"UNWIND ${property_identifier} AS rel")
-    q.append(f"MATCH (a{start_node_label_string}), (b{end_node_label_string})")
-
-    # collect WHERE clauses
-    where_clauses = []
-    for property in start_node_properties:
-        if isinstance(property, ArrayProperty):
-            where_clauses.append(f'rel.start_{property} IN a.{property}')
-        else:
-            where_clauses.append('a.{0} = rel.start_{0}'.format(property))
-    for property in end_node_properties:
-        if isinstance(property, ArrayProperty):
-            where_clauses.append(f'rel.end_{property} IN b.{property}')
-        else:
-            where_clauses.append('b.{0} = rel.end_{0}'.format(property))
-
-    q.append("WHERE " + ' AND '.join(where_clauses))
+    for clause in rels_match_clauses(start_node_labels, end_node_labels, start_node_properties,
+                                     end_node_properties):
+        q.append(clause)
 
     q.append(f"CREATE (a)-[r:{rel_type}]->(b)")
     q.append("SET r = rel.properties")
@@ -279,27 +376,11 @@ def rels_merge_factory(start_node_labels, end_node_labels, start_node_properties
     if not property_identifier:
         property_identifier = 'rels'
 
-    start_node_label_string = get_label_string_from_list_of_labels(start_node_labels)
-    end_node_label_string = get_label_string_from_list_of_labels(end_node_labels)
-
     q = CypherQuery()
     q.append(f"UNWIND ${property_identifier} AS rel")
-    q.append(f"MATCH (a{start_node_label_string}), (b{end_node_label_string})")
-
-    # collect WHERE clauses
-    where_clauses = []
-    for property in start_node_properties:
-        if isinstance(property, ArrayProperty):
-            where_clauses.append(f'rel.start_{property} IN a.{property}')
-        else:
-            where_clauses.append('a.{0} = rel.start_{0}'.format(property))
-    for property in end_node_properties:
-        if isinstance(property, ArrayProperty):
-            where_clauses.append(f'rel.end_{property} IN b.{property}')
-        else:
-            where_clauses.append('b.{0} = rel.end_{0}'.format(property))
-
-    q.append("WHERE " + ' AND '.join(where_clauses))
+    for clause in rels_match_clauses(start_node_labels, end_node_labels, start_node_properties,
+                                     end_node_properties):
+        q.append(clause)
 
     q.append(f"MERGE (a)-[r:{rel_type}]->(b)")
     q.append("ON CREATE SET r = rel.properties")
@@ -7,12 +7,18 @@ from neo4j.exceptions import ServiceUnavailable
 
 from time import sleep
 
+from graphio.helper import create_indexes, label_index_queries
+
 logging.basicConfig()
 
 log = logging.getLogger(__name__)
 
 NEO4J_PASSWORD = 'test'
 
+# driver connection pool settings
+MAX_CONNECTION_POOL_SIZE = 100
+CONNECTION_ACQUISITION_TIMEOUT = 60
+
 RUN_ENVIRONMENT = os.getenv('RUN_ENVIRONMENT', None)
 DRIVER = os.getenv('DRIVER', None)
 
@@ -64,14 +70,47 @@ def wait_for_neo4j():
 def graph(request, wait_for_neo4j):
     if request.param['lib'] == 'neodriver':
         uri = f"{request.param['uri_prefix']}://{request.param['host']}:{request.param['ports'][2]}"
-        yield GraphDatabase.driver(uri, auth=("neo4j", NEO4J_PASSWORD))
+        driver = GraphDatabase.driver(uri, auth=("neo4j", NEO4J_PASSWORD),
+                                      max_connection_pool_size=MAX_CONNECTION_POOL_SIZE,
+                                      connection_acquisition_timeout=CONNECTION_ACQUISITION_TIMEOUT)
+        yield driver
+        driver.close()
+
+
+@pytest.fixture(scope='session')
+def test_indexes(graph):
+    """
+    Indexes on the labels/properties used to match start and end nodes in relationship tests. Created once
+    per database, `clear_graph` does not remove indexes.
+    """
+    create_indexes(graph, label_index_queries(['Test', 'Foo', 'Bar'], ['uuid']))
+
+
+@pytest.fixture
+def drop_indexes(graph):
+    """
+    Return a function that drops all indexes on the given labels. Index tests call it first so that they do
+    not pass on indexes left by other tests or an earlier run.
+    """
+    def _drop_indexes(labels):
+        with graph.session() as s:
+            names = s.run(
+                "SHOW INDEXES YIELD name, labelsOrTypes WHERE any(l IN labelsOrTypes WHERE l IN $labels) "
+                "RETURN collect(name)",
+                labels=labels
+            ).single().value()
+            for name in names:
+                s.run(f"DROP INDEX `{name}`").consume()
+
+    return _drop_indexes
 
 
 @pytest.fixture
 def clear_graph(graph):
     if isinstance(graph, Driver):
         with graph.session() as s:
-            s.run("MATCH (n) DETACH DELETE n")
+            # delete in batches to avoid locking all nodes in one large transaction
+            s.run("MATCH (n) CALL { WITH n DETACH DELETE n } IN TRANSACTIONS OF 10000 ROWS").consume()
 
 
 @pytest.fixture
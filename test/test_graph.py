@@ -1,4 +1,4 @@
-from graphio.graph import run_query_return_results
+from graphio.graph import run_query_return_results, run_query_in_batches, run_query_return_single_value
 
 def test_create_query_fixed_property(graph, clear_graph):
 
@@ -8,3 +8,19 @@ def test_create_query_fixed_property(graph, clear_graph):
 
     r = run_query_return_results(graph, "MATCH (a:Test) RETURN count(a)")
     assert r[0][0] == 1
+
+
+def test_run_query_in_batches(graph, clear_graph):
+
+    q = "UNWIND $props AS properties CREATE (a:Test) SET a = properties"
+
+    run_query_in_batches(graph, q, ({'props': [{'uuid': i}, {'uuid': i + 100}]} for i in range(10)))
+
+    assert run_query_return_single_value(graph, "MATCH (a:Test) RETURN count(a)") == 20
+
+
+def test_run_query_return_single_value(graph, clear_graph):
+
+    run_query_return_results(graph, "CREATE (a:Test) SET a.key = 'value'")
+
+    assert run_query_return_single_value(graph, "MATCH (a:Test) RETURN a.key") == 'value'
@@ -1,5 +1,30 @@
-from graphio.helper import create_single_index, create_composite_index
-from graphio.graph import run_query_return_results
+from graphio.helper import create_single_index, create_composite_index, label_index_queries, create_indexes
+from graphio.graph import run_query_return_single_value
+
+
+def test_label_index_queries():
+    assert label_index_queries(['Foo'], ['bar']) == ["CREATE INDEX IF NOT EXISTS FOR (n:Foo) ON (n.bar)"]
+    assert label_index_queries(['Foo', 'Bar'], ['a', 'b']) == [
+        "CREATE INDEX IF NOT EXISTS FOR (n:Foo) ON (n.a)",
+        "CREATE INDEX IF NOT EXISTS FOR (n:Foo) ON (n.b)",
+        "CREATE INDEX IF NOT EXISTS FOR (n:Foo) ON (n.a,n.b)",
+        "CREATE INDEX IF NOT EXISTS FOR (n:Bar) ON (n.a)",
+        "CREATE INDEX IF NOT EXISTS FOR (n:Bar) ON (n.b)",
+        "CREATE INDEX IF NOT EXISTS FOR (n:Bar) ON (n.a,n.b)"
+    ]
+
+
+def test_create_indexes(graph, clear_graph):
+    create_indexes(graph, label_index_queries(['Foo'], ['bar', 'keks']))
+
+    indexed_properties = run_query_return_single_value(
+        graph,
+        "SHOW INDEXES YIELD labelsOrTypes, properties WHERE labelsOrTypes = $labels RETURN collect(properties)",
+        labels=['Foo']
+    )
+    assert ['bar'] in indexed_properties
+    assert ['keks'] in indexed_properties
+    assert ['bar', 'keks'] in indexed_properties
 
 def test_create_single_index(graph, clear_graph):
     test_label = 'Foo'
@@ -7,22 +32,12 @@ def test_create_single_index(graph, clear_graph):
 
     create_single_index(graph, test_label, test_prop)
 
-    # TODO keep until 4.2 is not supported anymore
-    try:
-        result = run_query_return_results(graph, "SHOW INDEXES YIELD *")
-    except:
-        result = run_query_return_results(graph, "CALL db.indexes()")
-    row = result[0]
-
-    # the result of the db.indexes() procedure is different for Neo4j 3.5 and 4
-    # this should also be synced with differences in py2neo versions
-    if 'tokenNames' in row:
-        assert row['tokenNames'] == [test_label]
-        assert row['properties'] == [test_prop]
-
-    elif 'labelsOrTypes' in row:
-        assert row['labelsOrTypes'] == [test_label]
-        assert row['properties'] == [test_prop]
+    assert run_query_return_single_value(
+        graph,
+        "SHOW INDEXES YIELD labelsOrTypes, properties WHERE labelsOrTypes = $labels AND properties = $properties "
+        "RETURN count(*)",
+        labels=[test_label], properties=[test_prop]
+    ) == 1
 
 
 def test_create_composite_index(graph, clear_graph):
@@ -31,22 +46,9 @@ def test_create_composite_index(graph, clear_graph):
 
     create_composite_index(graph, test_label, test_properties)
 
-    # TODO keep until 4.2 is not supported anymore
-    try:
-        result = run_query_return_results(graph, "SHOW INDEXES YIELD *")
-    except:
-        result = run_query_return_results(graph, "CALL db.indexes()")
-
-    row = result[0]
-
-    # the result of the db.indexes() procedure is different for Neo4j 3.5 and 4
-    # this should also be synced with differences in py2neo versions
-    if 'tokenNames' in row:
-        assert row['tokenNames'] == [test_label]
-        # cast to set in case lists have different order
-        assert set(row['properties']) == set(test_properties)
-
-    elif 'labelsOrTypes' in row:
-        assert row['labelsOrTypes'] == [test_label]
-        # cast to set in case lists have different order
-        assert set(row['properties']) == set(test_properties)
+    assert run_query_return_single_value(
+        graph,
+        "SHOW INDEXES YIELD labelsOrTypes, properties WHERE labelsOrTypes = $labels AND properties = $properties "
+        "RETURN count(*)",
+        labels=[test_label], properties=test_properties
+    ) == 1
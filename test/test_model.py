@@ -1,6 +1,21 @@
+import pytest
 from pytest import raises
 
 from graphio.model import ModelNode, ModelRelationship, Label, MergeKey, NodeDescriptor
+from graphio.queries import nodes_exists_factory
+from graphio.graph import run_query_return_results
+
+
+@pytest.fixture(scope='module')
+def test_node_class():
+    """
+    Model class shared by the instance and graph tests, the class is only built once per module.
+    """
+    class TestNode(ModelNode):
+        test = Label('Test')
+        name = MergeKey('name')
+
+    return TestNode
 
 
 class TestNodeDescriptor:
@@ -64,6 +79,10 @@ class TestModelNodeClass:
         assert 'Test' in Test.__labels__
         assert Test.sid == 'sid'
 
+    def test_string_containers_have_no_dict(self):
+        assert not hasattr(Label('Test'), '__dict__')
+        assert not hasattr(MergeKey('sid'), '__dict__')
+
     def test_model_node_factory(self):
         SomeNodeClass = ModelNode.factory(['Person'], merge_keys=['name'], name='PersonClass')
         assert issubclass(SomeNodeClass, ModelNode)
@@ -71,16 +90,100 @@ class TestModelNodeClass:
         assert SomeNodeClass.__labels__ == ['Person']
         assert SomeNodeClass.__merge_keys__ == ['name']
 
+    def test_queries_on_class(self):
+        class Test(ModelNode):
+            test = Label('Test')
+            sid = MergeKey('sid')
+
+        assert Test._exists_query == nodes_exists_factory(['Test'], ['sid'])
+
 
 class TestModelNodeInstance:
     """
     Test functionalities to create instances of model nodes.
     """
 
-    def test_merge_properties(self):
+    def test_merge_properties(self, test_node_class):
+        TestNode = test_node_class
+
+        t = TestNode(name='Peter')
+        assert t.merge_props == {'name': 'Peter'}
+
+    def test_merge_properties_missing(self, test_node_class):
+        TestNode = test_node_class
+
+        t = TestNode(age=12)
+        with raises(TypeError):
+            t.merge_props
+
+    def test_merge_properties_multiple_keys(self):
         class TestNode(ModelNode):
             test = Label('Test')
             name = MergeKey('name')
+            age = MergeKey('age')
+
+        t = TestNode(name='Peter', age=12, city='Berlin')
+        assert t.merge_props == {'name': 'Peter', 'age': 12}
+        assert TestNode._merge_key_getter(t.properties) == ('Peter', 12)
+
+    def test_additional_properties(self, test_node_class):
+        TestNode = test_node_class
+
+        t = TestNode(name='Peter', age=12)
+        assert t.additional_props == {'age': 12}
+
+    def test_exists_many_without_query(self, test_node_class):
+        TestNode = test_node_class
+
+        # no graph is needed: nothing to check or invalid instances return/raise before a query is sent
+        assert TestNode.exists_many(None, []) == []
+        with raises(TypeError):
+            TestNode.exists_many(None, [TestNode(age=12)])
+
+    def test_slots_subclass(self):
+        class TestNode(ModelNode):
+            __slots__ = ()
+            test = Label('Test')
+            name = MergeKey('name')
 
         t = TestNode(name='Peter')
-        assert t.merge_props == {'name': 'Peter'}
+        assert t.properties == {'name': 'Peter'}
+        assert not hasattr(t, '__dict__')
+
+
+class TestModelNodeGraph:
+    """
+    Test functions that interact with the graph.
+    """
+
+    def test_exists(self, graph, clear_graph, test_node_class):
+        TestNode = test_node_class
+
+        run_query_return_results(graph, "CREATE (n:Test {name: 'Peter'})")
+
+        assert TestNode(name='Peter').exists(graph)
+        assert not TestNode(name='Paul').exists(graph)
+
+    def test_exists_many(self, graph, clear_graph, test_node_class):
+        TestNode = test_node_class
+
+        run_query_return_results(graph, "CREATE (n:Test {name: 'Peter'})")
+
+        result = TestNode.exists_many(graph, [TestNode(name='Peter'), TestNode(name='Paul')])
+        assert result == [True, False]
+
+    def test_exists_many_same_instance_twice(self, graph, clear_graph, test_node_class):
+        TestNode = test_node_class
+
+        run_query_return_results(graph, "CREATE (n:Test {name: 'Peter'})")
+
+        peter = TestNode(name='Peter')
+        assert TestNode.exists_many(graph, [peter, TestNode(name='Paul'), peter]) == [True, False, True]
+
+    def test_exists_raises_type_error(self, graph, clear_graph, test_node_class):
+        TestNode = test_node_class
+
+        run_query_return_results(graph, "UNWIND $names AS name CREATE (n:Test {name: name})", names=['Peter', 'Peter'])
+
+        with raises(TypeError):
+            TestNode(name='Peter').exists(graph)
@@ -0,0 +1,62 @@
+from graphio.objects.datacontainer import Container
+from graphio import NodeSet, RelationshipSet
+from graphio.graph import run_query_return_single_value
+
+
+def test_container_get_nodeset():
+    person = NodeSet(['Person'], merge_keys=['name'])
+    movie = NodeSet(['Movie', 'Film'], merge_keys=['title', 'year'])
+    rels = RelationshipSet('LIKES', ['Person'], ['Movie'], ['name'], ['title'])
+
+    c = Container([person, movie, rels])
+
+    assert c.get_nodeset(['Person'], ['name']) is person
+    assert c.get_nodeset(['Film', 'Movie'], ['year', 'title']) is movie
+    assert c.get_nodeset(['Person'], ['age']) is None
+    assert c.relationshipsets == [rels]
+
+
+def test_container_get_nodeset_after_add():
+    person = NodeSet(['Person'], merge_keys=['name'])
+    other_person = NodeSet(['Person'], merge_keys=['name'])
+
+    c = Container()
+    c.add(person)
+    c.add_all([other_person])
+
+    # the first NodeSet added is returned
+    assert c.get_nodeset(['Person'], ['name']) is person
+
+
+def test_container_get_nodeset_after_direct_changes():
+    person = NodeSet(['Person'], merge_keys=['name'])
+    movie = NodeSet(['Movie'], merge_keys=['title'])
+
+    c = Container()
+    c.objects.append(person)
+    assert c.get_nodeset(['Person'], ['name']) is person
+
+    c.objects = [movie]
+    assert c.get_nodeset(['Person'], ['name']) is None
+
+    movie.merge_keys = ['title', 'year']
+    assert c.get_nodeset(['Movie'], ['title', 'year']) is movie
+
+
+def test_container_merge_and_create(graph, clear_graph):
+    person = NodeSet(['Person'], merge_keys=['name'])
+    city = NodeSet(['City'], merge_keys=['name'])
+    lives_in = RelationshipSet('LIVES_IN', ['Person'], ['City'], ['name'], ['name'])
+
+    person.add_node({'name': 'Peter'})
+    person.add_node({'name': 'Paul'})
+    city.add_node({'name': 'Berlin'})
+    lives_in.add_relationship({'name': 'Peter'}, {'name': 'Berlin'})
+    lives_in.add_relationship({'name': 'Paul'}, {'name': 'Berlin'})
+
+    c = Container([person, city, lives_in])
+    c.merge_nodesets(graph)
+    c.create_relationshipsets(graph)
+
+    assert run_query_return_single_value(graph, "MATCH (n:Person) RETURN count(n)") == 2
+    assert run_query_return_single_value(graph, "MATCH (:Person)-[r:LIVES_IN]->(:City) RETURN count(r)") == 2
@@ -4,7 +4,7 @@ import json
 from hypothesis import given, strategies as st
 
 from graphio.objects.nodeset import NodeSet
-from graphio.graph import run_query_return_results
+from graphio.graph import run_query_return_single_value
 
 
 @pytest.fixture(scope="session")
@@ -97,6 +97,18 @@ def test_nodeset_merge_key_id():
     merge_key_id = ns._merge_key_id({'name': 'Peter', 'foo': 'bar'})
     assert merge_key_id == ('Peter', 'bar')
 
+    ns = NodeSet(['Test'], ['name'])
+    assert ns._merge_key_id({'name': 'Peter', 'foo': 'bar'}) == ('Peter',)
+
+
+def test_nodeset_only_merge_key_properties():
+    ns = NodeSet(['Test'], ['name', 'foo'])
+    ns.add_node({'name': 'Peter', 'foo': 'bar'})
+    assert ns._only_merge_key_properties()
+
+    ns.add_node({'name': 'Paul', 'foo': 'bar', 'age': 20})
+    assert not ns._only_merge_key_properties()
+
 
 class TestNodeSetInstances:
 
@@ -175,40 +187,37 @@ class TestNodeSetCreate:
     def test_nodeset_create_number(self, small_nodeset, graph, clear_graph):
         small_nodeset.create(graph)
 
-        result = run_query_return_results(graph, "MATCH (n:{}) RETURN count(n)".format(':'.join(small_nodeset.labels)))
+        result = run_query_return_single_value(graph, "MATCH (n:{}) RETURN count(n)".format(':'.join(small_nodeset.labels)))
 
-        assert result[0][0] == 100
+        assert result == 100
 
     def test_nodeset_create_twice_number(self, small_nodeset, graph, clear_graph):
         small_nodeset.create(graph)
         small_nodeset.create(graph)
 
-        result = run_query_return_results(graph, "MATCH (n:{}) RETURN count(n)".format(':'.join(small_nodeset.labels)))
-        print(result)
-        assert result[0][0] == 200
+        result = run_query_return_single_value(graph, "MATCH (n:{}) RETURN count(n)".format(':'.join(small_nodeset.labels)))
+        assert result == 200
 
     def test_nodeset_create_properties(self, small_nodeset, graph, clear_graph):
         small_nodeset.create(graph)
 
-        result = run_query_return_results(graph, "MATCH (n:{}) RETURN n".format(':'.join(small_nodeset.labels)))
+        result = run_query_return_single_value(graph, "MATCH (n:{}) RETURN collect(DISTINCT n.key)".format(':'.join(small_nodeset.labels)))
 
-        for row in result:
-            node = row[0]
-            assert node['key'] == 'value'
+        assert result == ['value']
 
     def test_create_nodeset_multiple_labels(self, nodeset_multiple_labels, graph, clear_graph):
         nodeset_multiple_labels.create(graph)
 
-        result = run_query_return_results(graph, "MATCH (n:{}) RETURN count(n)".format(':'.join(nodeset_multiple_labels.labels)))
+        result = run_query_return_single_value(graph, "MATCH (n:{}) RETURN count(n)".format(':'.join(nodeset_multiple_labels.labels)))
 
-        assert result[0][0] == 100
+        assert result == 100
 
     def test_nodeset_create_no_label(self, nodeset_no_label, graph, clear_graph):
         nodeset_no_label.create(graph)
 
-        result = run_query_return_results(graph, "MATCH (n) RETURN count(n)")
+        result = run_query_return_single_value(graph, "MATCH (n) RETURN count(n)")
 
-        assert result[0][0] == 100
+        assert result == 100
 
 
     def test_nodeset_create_additional_labels(self, graph, clear_graph):
@@ -217,20 +226,23 @@ class TestNodeSetCreate:
             ns.add_node({'key': i})
 
         ns.create(graph)
-        result = run_query_return_results(graph, "MATCH (n:Test:Foo:Bar) RETURN count(n)")
-        assert result[0][0] == 10
+        result = run_query_return_single_value(graph, "MATCH (n:Test:Foo:Bar) RETURN count(n)")
+        assert result == 10
 
         ns.create(graph)
-        result = run_query_return_results(graph, "MATCH (n:Test:Foo:Bar) RETURN count(n)")
-        assert result[0][0] == 20
+        result = run_query_return_single_value(graph, "MATCH (n:Test:Foo:Bar) RETURN count(n)")
+        assert result == 20
 
     def test_nodeset_create_source(self, graph, clear_graph, small_nodeset):
         small_nodeset.source = True
         small_nodeset.create(graph)
 
-        assert run_query_return_results(graph, f"MATCH (n:Test) WHERE '{small_nodeset.uuid}' IN n._source RETURN count(n)")[0][0] == 100
-        assert run_query_return_results(graph, f"MATCH (n:Test) WHERE size(n._source) = 1 RETURN count(n)")[0][0] == 100
-        assert run_query_return_results(graph, f"MATCH (n:Test) WHERE size(n._source) <> 1 RETURN count(n)")[0][0] == 0
+        assert run_query_return_single_value(
+            graph,
+            "MATCH (n:Test) RETURN [count(CASE WHEN $uuid IN n._source THEN 1 END), "
+            "count(CASE WHEN size(n._source) = 1 THEN 1 END), count(CASE WHEN size(n._source) <> 1 THEN 1 END)]",
+            uuid=small_nodeset.uuid
+        ) == [100, 100, 0]
 
 
 class TestNodeSetIndex:
@@ -242,22 +254,12 @@ class TestNodeSetIndex:
 
         ns.create_index(graph)
 
-        # TODO keep until 4.2 is not supported anymore
-        try:
-            result = run_query_return_results(graph, "SHOW INDEXES YIELD *")
-        except:
-            result = run_query_return_results(graph, "CALL db.indexes()")
-
-        for row in result:
-            # the result of the db.indexes() procedure is different for Neo4j 3.5 and 4
-            # this should also be synced with differences in py2neo versions
-            if 'tokenNames' in row:
-                assert row['tokenNames'] == labels and row['properties'] == properties \
-                       or row['tokenNames'] == labels and row['properties'] == properties
-
-            elif 'labelsOrTypes' in row:
-                assert row['labelsOrTypes'] == labels and row['properties'] == properties \
-                       or row['labelsOrTypes'] == labels and row['properties'] == properties
+        assert run_query_return_single_value(
+            graph,
+            "SHOW INDEXES YIELD labelsOrTypes, properties WHERE labelsOrTypes = $labels AND properties = $properties "
+            "RETURN count(*)",
+            labels=labels, properties=properties
+        ) == 1
 
     def test_nodeset_create_composite_index(self, graph, clear_graph):
         labels = ['TestNode']
@@ -266,22 +268,12 @@ class TestNodeSetIndex:
 
         ns.create_index(graph)
 
-        # TODO keep until 4.2 is not supported anymore
-        try:
-            result = run_query_return_results(graph, "SHOW INDEXES YIELD *")
-        except:
-            result = run_query_return_results(graph, "CALL db.indexes()")
-
-        for row in result:
-            # the result of the db.indexes() procedure is different for Neo4j 3.5 and 4
-            # this should also be synced with differences in py2neo versions
-            if 'tokenNames' in row:
-                assert row['tokenNames'] == labels and row['properties'] == properties \
-                       or row['tokenNames'] == labels and row['properties'] == properties
-
-            elif 'labelsOrTypes' in row:
-                assert row['labelsOrTypes'] == labels and row['properties'] == properties \
-                       or row['labelsOrTypes'] == labels and row['properties'] == properties
+        assert run_query_return_single_value(
+            graph,
+            "SHOW INDEXES YIELD labelsOrTypes, properties WHERE labelsOrTypes = $labels AND properties = $properties "
+            "RETURN count(*)",
+            labels=labels, properties=properties
+        ) == 1
 
     def test_nodeset_recreate_existing_single_index(self, graph, clear_graph):
         """
@@ -299,7 +291,7 @@ class TestNodeSetIndex:
 
 
 class TestNodeSetMerge:
-    def test_nodeset_merge_preserve(self, graph, clear_graph):
+    def test_nodeset_merge_preserve(self, graph, clear_graph, test_indexes):
         """
         Merge a nodeset 3 times and check number of nodes.
         """
@@ -315,10 +307,13 @@ class TestNodeSetMerge:
 
         do_not_overwrite_ns.merge(graph)
 
-        assert run_query_return_results(graph, "MATCH (n:Test) where n.key = 'value' RETURN count(n)")[0][0] == 100
-        assert run_query_return_results(graph, "MATCH (n:Test) where n.key = 'other_value' RETURN count(n)")[0][0] == 0
+        assert run_query_return_single_value(
+            graph,
+            "MATCH (n:Test) RETURN [count(CASE WHEN n.key = 'value' THEN 1 END), "
+            "count(CASE WHEN n.key = 'other_value' THEN 1 END)]"
+        ) == [100, 0]
 
-    def test_nodeset_merge_append_props(self, graph, clear_graph):
+    def test_nodeset_merge_append_props(self, graph, clear_graph, test_indexes):
         """
         Merge a nodeset 3 times and check number of nodes.
         """
@@ -333,10 +328,9 @@ class TestNodeSetMerge:
             append_ns.add_node({'uuid': i, 'key': 'other_value'})
 
         append_ns.merge(graph)
-        assert run_query_return_results(graph, "MATCH (n:Test) where 'value' in n.key and 'other_value' in n.key RETURN count(n)")[0][
-                   0] == 100
+        assert run_query_return_single_value(graph, "MATCH (n:Test) where 'value' in n.key and 'other_value' in n.key RETURN count(n)") == 100
 
-    def test_nodeset_merge_preserve_and_append_props(self, graph, clear_graph):
+    def test_nodeset_merge_preserve_and_append_props(self, graph, clear_graph, test_indexes):
         """
         Merge a nodeset 3 times and check number of nodes.
         """
@@ -345,8 +339,11 @@ class TestNodeSetMerge:
             ns.add_node({'uuid': i, 'key': 'value', 'other_key': 'bar'})
 
         ns.merge(graph)
-        assert run_query_return_results(graph, "MATCH (n:Test) where 'value' IN n.key RETURN count(n)")[0][0] == 100
-        assert run_query_return_results(graph, "MATCH (n:Test) where n.other_key = 'bar' RETURN count(n)")[0][0] == 100
+        assert run_query_return_single_value(
+            graph,
+            "MATCH (n:Test) RETURN [count(CASE WHEN 'value' IN n.key THEN 1 END), "
+            "count(CASE WHEN n.other_key = 'bar' THEN 1 END)]"
+        ) == [100, 100]
 
         append_ns = NodeSet(['Test'], merge_keys=['uuid'], append_props=['key'], preserve=['other_key'])
         for i in range(100):
@@ -354,12 +351,13 @@ class TestNodeSetMerge:
 
         append_ns.merge(graph)
 
-        assert run_query_return_results(graph, "MATCH (n:Test) where 'value' in n.key and 'other_value' in n.key RETURN count(n)")[0][
-                   0] == 100
-        assert run_query_return_results(graph, "MATCH (n:Test) where n.other_key = 'bar' RETURN count(n)")[0][0] == 100
-        assert run_query_return_results(graph, "MATCH (n:Test) where n.other_key = 'foo' RETURN count(n)")[0][0] == 0
+        assert run_query_return_single_value(
+            graph,
+            "MATCH (n:Test) RETURN [count(CASE WHEN 'value' IN n.key AND 'other_value' IN n.key THEN 1 END), "
+            "count(CASE WHEN n.other_key = 'bar' THEN 1 END), count(CASE WHEN n.other_key = 'foo' THEN 1 END)]"
+        ) == [100, 100, 0]
 
-    def test_nodeset_merge_preserve_keeps_append_props(self, graph, clear_graph):
+    def test_nodeset_merge_preserve_keeps_append_props(self, graph, clear_graph, test_indexes):
         """
         Merge a nodeset 3 times and check number of nodes.
         """
@@ -368,7 +366,7 @@ class TestNodeSetMerge:
             ns.add_node({'uuid': i, 'key': 'value'})
 
         ns.merge(graph)
-        assert run_query_return_results(graph, "MATCH (n:Test) where 'value' IN n.key RETURN count(n)")[0][0] == 100
+        assert run_query_return_single_value(graph, "MATCH (n:Test) where 'value' IN n.key RETURN count(n)") == 100
 
         append_ns = NodeSet(['Test'], merge_keys=['uuid'], append_props=['key'], preserve=['key'])
         for i in range(100):
@@ -376,30 +374,51 @@ class TestNodeSetMerge:
 
         append_ns.merge(graph)
 
-        assert run_query_return_results(graph, "MATCH (n:Test) where 'value' IN n.key RETURN count(n)")[0][0] == 100
-        assert run_query_return_results(graph, "MATCH (n:Test) where 'other_value' IN n.key RETURN count(n)")[0][0] == 0
+        assert run_query_return_single_value(
+            graph,
+            "MATCH (n:Test) RETURN [count(CASE WHEN 'value' IN n.key THEN 1 END), "
+            "count(CASE WHEN 'other_value' IN n.key THEN 1 END)]"
+        ) == [100, 0]
 
-    def test_nodeset_merge_number(self, small_nodeset, graph, clear_graph):
+    def test_nodeset_merge_number(self, small_nodeset, graph, clear_graph, test_indexes):
         """
-        Merge a nodeset 3 times and check number of nodes.
+        Merge a nodeset twice and check number of nodes.
         """
         small_nodeset.merge(graph)
         small_nodeset.merge(graph)
-        small_nodeset.merge(graph)
 
-        result = run_query_return_results(graph, "MATCH (n:{}) RETURN count(n)".format(':'.join(small_nodeset.labels)))
+        result = run_query_return_single_value(graph, "MATCH (n:{}) RETURN count(n)".format(':'.join(small_nodeset.labels)))
+
+        assert result == 100
+
+    def test_nodeset_merge_ensure_index(self, graph, clear_graph, drop_indexes):
+        # label not covered by the `test_indexes` fixture, its indexes are dropped first
+        drop_indexes(['EnsureIndex'])
+        ns = NodeSet(['EnsureIndex'], merge_keys=['uuid'])
+        for i in range(100):
+            ns.add_node({'uuid': i})
+
+        ns.merge(graph, ensure_index=True)
+
+        assert run_query_return_single_value(
+            graph,
+            "SHOW INDEXES YIELD labelsOrTypes, properties WHERE labelsOrTypes = $labels AND properties = $properties "
+            "RETURN count(*)",
+            labels=['EnsureIndex'], properties=['uuid']
+        ) == 1
 
-        assert result[0][0] == 100
+        result = run_query_return_single_value(graph, "MATCH (n:EnsureIndex) RETURN count(n)")
+        assert result == 100
 
     def test_nodeset_merge_no_label(self, nodeset_no_label, graph, clear_graph):
         nodeset_no_label.merge(graph)
         nodeset_no_label.merge(graph)
 
-        result = run_query_return_results(graph, "MATCH (n) RETURN count(n)")
+        result = run_query_return_single_value(graph, "MATCH (n) RETURN count(n)")
 
-        assert result[0][0] == 100
+        assert result == 100
 
-    def test_nodeset_merge_additional_labels(self, graph, clear_graph):
+    def test_nodeset_merge_additional_labels(self, graph, clear_graph, test_indexes):
         ns = NodeSet(['Test'], merge_keys=['uuid'], additional_labels=['Foo', 'Bar'])
         ns.add_node({'uuid': 1})
         ns2 = NodeSet(['Test'], merge_keys=['uuid'], additional_labels=['Kurt', 'Peter'])
@@ -410,13 +429,13 @@ class TestNodeSetMerge:
         ns2.merge(graph)
         ns2.merge(graph)
 
-        result = run_query_return_results(graph, "MATCH (n:Test) RETURN count(n)")
-        assert result[0][0] == 1
+        result = run_query_return_single_value(graph, "MATCH (n:Test) RETURN count(n)")
+        assert result == 1
 
-        result = run_query_return_results(graph, "MATCH (n:Test:Foo:Bar:Kurt:Peter) RETURN count(n)")
-        assert result[0][0] == 1
+        result = run_query_return_single_value(graph, "MATCH (n:Test:Foo:Bar:Kurt:Peter) RETURN count(n)")
+        assert result == 1
 
-    def test_nodeset_source(self, graph, clear_graph):
+    def test_nodeset_source(self, graph, clear_graph, test_indexes):
         """
         Merge a nodeset 3 times and check number of nodes.
         """
@@ -426,10 +445,14 @@ class TestNodeSetMerge:
 
         ns.merge(graph)
 
-        assert run_query_return_results(graph, f"MATCH (n:Test) where '{ns.uuid}' IN n._source RETURN count(n)")[0][0] == 100
-        assert run_query_return_results(graph, "MATCH (n:Test) WHERE size(n._source) = 1 RETURN count(n)")[0][0] == 100
+        assert run_query_return_single_value(
+            graph,
+            "MATCH (n:Test) RETURN [count(CASE WHEN $uuid IN n._source THEN 1 END), "
+            "count(CASE WHEN size(n._source) = 1 THEN 1 END)]",
+            uuid=ns.uuid
+        ) == [100, 100]
 
-    def test_nodeset_source_update(self, graph, clear_graph):
+    def test_nodeset_source_update(self, graph, clear_graph, test_indexes):
         """
         Merge a nodeset 3 times and check number of nodes.
         """
@@ -445,10 +468,13 @@ class TestNodeSetMerge:
             ns2.add_node({'uuid': i, 'key': 'value'})
         ns2.merge(graph)
 
-        assert run_query_return_results(graph, f"MATCH (n:Test) where '{ns.uuid}' IN n._source RETURN count(n)")[0][0] == 100
-        assert run_query_return_results(graph, f"MATCH (n:Test) where '{ns2.uuid}' IN n._source RETURN count(n)")[0][0] == 100
-        assert run_query_return_results(graph, "MATCH (n:Test) WHERE size(n._source) = 2 RETURN count(n)")[0][0] == 100
-        assert run_query_return_results(graph, "MATCH (n:Test) WHERE size(n._source) <> 2 RETURN count(n)")[0][0] == 0
+        assert run_query_return_single_value(
+            graph,
+            "MATCH (n:Test) RETURN [count(CASE WHEN $uuid IN n._source THEN 1 END), "
+            "count(CASE WHEN $uuid2 IN n._source THEN 1 END), count(CASE WHEN size(n._source) = 2 THEN 1 END), "
+            "count(CASE WHEN size(n._source) <> 2 THEN 1 END)]",
+            uuid=ns.uuid, uuid2=ns2.uuid
+        ) == [100, 100, 100, 0]
 
 
 
@@ -558,8 +584,9 @@ class TestNodeSetCSVandJSON:
         assert ns.merge_keys == ['test_id']
 
         ns.merge(graph)
-        assert run_query_return_results(graph, "MATCH (n:Test) RETURN count(n)")[0][0] == 2
-        assert isinstance(run_query_return_results(graph, "MATCH (n:Test) RETURN n.test_id")[0][0], int)
+        assert run_query_return_single_value(graph, "MATCH (n:Test) RETURN count(n)") == 2
+        test_ids = run_query_return_single_value(graph, "MATCH (n:Test) RETURN collect(n.test_id)")
+        assert all(isinstance(test_id, int) for test_id in test_ids)
 
     def test_read_from_files_load_items_to_memory(self, root_dir, clear_graph, graph):
 
@@ -578,7 +605,7 @@ class TestNodeSetCSVandJSON:
             assert isinstance(n['test_id'], int)
 
         ns.merge(graph)
-        assert run_query_return_results(graph, "MATCH (n:Test) RETURN count(n)")[0][0] == 2
+        assert run_query_return_single_value(graph, "MATCH (n:Test) RETURN count(n)") == 2
 
     def test_read_from_files_custom_json_keys_load_items_to_memory(self, root_dir, clear_graph, graph):
 
@@ -598,7 +625,7 @@ class TestNodeSetCSVandJSON:
             assert isinstance(n['test_id'], int)
 
         ns.merge(graph)
-        assert run_query_return_results(graph, "MATCH (n:Test) RETURN count(n)")[0][0] == 2
+        assert run_query_return_single_value(graph, "MATCH (n:Test) RETURN count(n)") == 2
 
     def test_write_files_read_again_load_items_into_memory(self, small_nodeset, tmp_path, clear_graph, graph):
         """
@@ -620,4 +647,4 @@ class TestNodeSetCSVandJSON:
             assert isinstance(n['uuid'], int)
 
         ns.merge(graph)
-        assert run_query_return_results(graph, "MATCH (n:Test) RETURN count(n)")[0][0] == len(small_nodeset.nodes)
\ No newline at end of file
+        assert run_query_return_single_value(graph, "MATCH (n:Test) RETURN count(n)") == len(small_nodeset.nodes)
\ No newline at end of file
@@ -8,7 +8,7 @@ import pytest
 from graphio.objects.nodeset import NodeSet
 from graphio.objects.relationshipset import RelationshipSet, tuplify_json_list
 from graphio.objects.properties import ArrayProperty
-from graphio.graph import run_query_return_results
+from graphio.graph import run_query_return_results, run_query_return_single_value
 
 
 @pytest.fixture
@@ -60,21 +60,17 @@ def small_relationshipset_multiple_labels_multiple_merge_keys():
 
 
 @pytest.fixture(scope='function')
-def create_nodes_test(graph, clear_graph):
-    ns1 = NodeSet(['Test'], merge_keys=['uuid'])
-    ns2 = NodeSet(['Foo'], merge_keys=['uuid'])
-    ns3 = NodeSet(['Bar'], merge_keys=['uuid', 'key'])
-
-    for i in range(100):
-        ns1.add_node({'uuid': i, 'array_key': [i, 9999, 99999]})
-        ns2.add_node({'uuid': i, 'array_key': [i, 7777, 77777]})
-        ns3.add_node({'uuid': i, 'key': i, 'array_key': [i, 6666, 66666]})
-
-    ns1.create(graph)
-    ns2.create(graph)
-    ns3.create(graph)
-
-    return ns1, ns2, ns3
+def create_nodes_test(graph, clear_graph, test_indexes):
+    """
+    Create 100 :Test, :Foo and :Bar nodes as start/end nodes in one query.
+    """
+    run_query_return_results(
+        graph,
+        "UNWIND range(0, 99) AS i "
+        "CREATE (:Test {uuid: i, array_key: [i, 9999, 99999]}), "
+        "(:Foo {uuid: i, array_key: [i, 7777, 77777]}), "
+        "(:Bar {uuid: i, key: i, array_key: [i, 6666, 66666]})"
+    )
 
 
 def test_str():
@@ -181,14 +177,14 @@ class TestRelationshipSetCreate:
         small_relationshipset_no_labels.create(graph)
 
         # check if 100 relationships are created for two labels
-        result = run_query_return_results(graph, "MATCH (t:Test)-[r:TEST]->(f:Foo) RETURN count(r)")
+        result = run_query_return_single_value(graph, "MATCH (t:Test)-[r:TEST]->(f:Foo) RETURN count(r)")
 
-        assert result[0][0] == 100
+        assert result == 100
 
         # Test that 900 (3*3*100) relationships are created in total
-        result = run_query_return_results(graph, "MATCH (t)-[r:TEST]->(f) RETURN count(r)")
+        result = run_query_return_single_value(graph, "MATCH (t)-[r:TEST]->(f) RETURN count(r)")
 
-        assert result[0][0] == 900
+        assert result == 900
 
     def test_relationshipset_create_no_properties(self, graph, create_nodes_test):
 
@@ -199,24 +195,28 @@ class TestRelationshipSetCreate:
 
         rs.create(graph)
 
-        result = run_query_return_results(graph, "MATCH (t:Test)-[r:TEST]->(f:Foo) RETURN count(r)")
+        result = run_query_return_single_value(graph, "MATCH (t:Test)-[r:TEST]->(f:Foo) RETURN count(r)")
 
-        assert result[0][0] == 100
+        assert result == 100
 
     def test_relationshipset_create_number(self, graph, create_nodes_test, small_relationshipset):
 
         small_relationshipset.create(graph)
 
-        result = run_query_return_results(graph, "MATCH (t:Test)-[r:TEST]->(f:Foo) RETURN count(r)")
+        result = run_query_return_single_value(graph, "MATCH (t:Test)-[r:TEST]->(f:Foo) RETURN count(r)")
 
-        assert result[0][0] == 100
+        assert result == 100
 
     def test_relationshipset_create_source(self, graph, create_nodes_test, small_relationshipset):
         small_relationshipset.source = True
         small_relationshipset.create(graph)
 
-        assert run_query_return_results(graph, f"MATCH (:Test)-[r:TEST]->(:Foo) WHERE '{small_relationshipset.uuid}' in r._source RETURN count(r)")[0][0] == 100
-        assert run_query_return_results(graph, f"MATCH (:Test)-[r:TEST]->(:Foo) WHERE size(r._source) = 1 RETURN count(r)")[0][0] == 100
+        assert run_query_return_single_value(
+            graph,
+            "MATCH (:Test)-[r:TEST]->(:Foo) RETURN [count(CASE WHEN $uuid IN r._source THEN 1 END), "
+            "count(CASE WHEN size(r._source) = 1 THEN 1 END)]",
+            uuid=small_relationshipset.uuid
+        ) == [100, 100]
 
     def test_relationshipset_create_mulitple_node_props(self, graph, create_nodes_test):
 
@@ -229,58 +229,47 @@ class TestRelationshipSetCreate:
 
         rs.create(graph)
 
-        result = run_query_return_results(graph, "MATCH (:Test)-[r:TEST]->(:Bar) RETURN count(r)")
-
-        assert result[0][0] == 100
-
-    def test_relationshipset_create_array_props(self, graph, create_nodes_test):
-
-        rs = RelationshipSet('TEST_ARRAY', ['Test'], ['Foo'], [ArrayProperty('array_key')], [ArrayProperty('array_key')])
-
-        for i in range(100):
-            rs.add_relationship({'array_key': i}, {'array_key': i})
-
-        rs.create(graph)
-
-        result = run_query_return_results(graph, "MATCH (t:Test)-[r:TEST_ARRAY]->(f:Foo) RETURN count(r)")
+        result = run_query_return_single_value(graph, "MATCH (:Test)-[r:TEST]->(:Bar) RETURN count(r)")
 
-        assert result[0][0] == 100
+        assert result == 100
 
-    def test_relationshipset_create_string_and_array_props(self, graph, create_nodes_test):
+    @pytest.mark.parametrize('with_uuid', [False, True], ids=['array', 'string_and_array'])
+    def test_relationshipset_create_array_props(self, graph, create_nodes_test, with_uuid):
 
         rs = RelationshipSet('TEST_ARRAY', ['Test'], ['Foo'], [ArrayProperty('array_key')], [ArrayProperty('array_key')])
 
         for i in range(100):
-            rs.add_relationship({'uuid': i, 'array_key': i}, {'uuid': i, 'array_key': i})
+            props = {'uuid': i, 'array_key': i} if with_uuid else {'array_key': i}
+            rs.add_relationship(props, props)
 
         rs.create(graph)
 
-        result = run_query_return_results(graph, "MATCH (t:Test)-[r:TEST_ARRAY]->(f:Foo) RETURN count(r)")
+        result = run_query_return_single_value(graph, "MATCH (t:Test)-[r:TEST_ARRAY]->(f:Foo) RETURN count(r)")
 
-        assert result[0][0] == 100
+        assert result == 100
 
 
 class TestRelationshipSetIndex:
-    def test_relationship_create_single_index(self, graph, clear_graph, small_relationshipset):
-
-        small_relationshipset.create_index(graph)
-
-        # TODO keep until 4.2 is not supported anymore
-        try:
-            result = run_query_return_results(graph, "SHOW INDEXES YIELD *")
-        except:
-            result = run_query_return_results(graph, "CALL db.indexes()")
-
-        for row in result:
-            # the result of the db.indexes() procedure is different for Neo4j 3.5 and 4
-            # this should also be synced with differences in py2neo versions
-            if 'tokenNames' in row:
-                assert row['tokenNames'] == ['Test'] and row['properties'] == ['uuid'] \
-                       or row['tokenNames'] == ['Test'] and row['properties'] == ['uuid']
-
-            elif 'labelsOrTypes' in row:
-                assert row['labelsOrTypes'] == ['Test'] and row['properties'] == ['uuid'] \
-                       or row['labelsOrTypes'] == ['Test'] and row['properties'] == ['uuid']
+    def test_relationship_create_single_index(self, graph, clear_graph, drop_indexes):
+        # labels not covered by the `test_indexes` fixture, their indexes are dropped first
+        drop_indexes(['IndexStart', 'IndexEnd'])
+        rs = RelationshipSet('TEST', ['IndexStart'], ['IndexEnd'], ['uuid'], ['uuid'])
+        rs.add_relationship({'uuid': 1}, {'uuid': 1})
+
+        rs.create_index(graph)
+
+        assert run_query_return_single_value(
+            graph,
+            "SHOW INDEXES YIELD labelsOrTypes, properties WHERE labelsOrTypes = $labels AND properties = $properties "
+            "RETURN count(*)",
+            labels=['IndexStart'], properties=['uuid']
+        ) == 1
+        assert run_query_return_single_value(
+            graph,
+            "SHOW INDEXES YIELD labelsOrTypes, properties WHERE labelsOrTypes = $labels AND properties = $properties "
+            "RETURN count(*)",
+            labels=['IndexEnd'], properties=['uuid']
+        ) == 1
 
 
 class TestRelationshipSetMerge:
@@ -288,100 +277,88 @@ class TestRelationshipSetMerge:
     def test_relationshipset_merge_number(self, graph, create_nodes_test, small_relationshipset):
         small_relationshipset.merge(graph)
 
-        result = run_query_return_results(graph, "MATCH (t:Test)-[r:TEST]->(f:Foo) RETURN count(r)")
+        result = run_query_return_single_value(graph, "MATCH (t:Test)-[r:TEST]->(f:Foo) RETURN count(r)")
 
-        assert result[0][0] == 100
+        assert result == 100
 
         # merge again to check that number stays the same
         small_relationshipset.merge(graph)
 
-        result = run_query_return_results(graph, "MATCH (t:Test)-[r:TEST]->(f:Foo) RETURN count(r)")
+        result = run_query_return_single_value(graph, "MATCH (t:Test)-[r:TEST]->(f:Foo) RETURN count(r)")
 
-        assert result[0][0] == 100
+        assert result == 100
 
     def test_relationshipset_merge_source(self, graph, create_nodes_test, small_relationshipset):
         small_relationshipset.source = True
         small_relationshipset.merge(graph)
 
-        assert run_query_return_results(graph, f"MATCH (:Test)-[r:TEST]->(:Foo) WHERE '{small_relationshipset.uuid}' in r._source RETURN count(r)")[0][0] == 100
-        assert run_query_return_results(graph, f"MATCH (:Test)-[r:TEST]->(:Foo) WHERE size(r._source) = 1 RETURN count(r)")[0][0] == 100
+        assert run_query_return_single_value(
+            graph,
+            "MATCH (:Test)-[r:TEST]->(:Foo) RETURN [count(CASE WHEN $uuid IN r._source THEN 1 END), "
+            "count(CASE WHEN size(r._source) = 1 THEN 1 END)]",
+            uuid=small_relationshipset.uuid
+        ) == [100, 100]
 
         # change uuid of relationshipset
         small_relationshipset.uuid = str(uuid4())
         small_relationshipset.merge(graph)
 
-        assert run_query_return_results(graph,f"MATCH (:Test)-[r:TEST]->(:Foo) WHERE '{small_relationshipset.uuid}' in r._source RETURN count(r)")[0][0] == 100
-
-        assert run_query_return_results(graph, f"MATCH (:Test)-[r:TEST]->(:Foo) WHERE size(r._source) = 2 RETURN count(r)")[0][0] == 100
-        assert run_query_return_results(graph, f"MATCH (:Test)-[r:TEST]->(:Foo) WHERE size(r._source) <> 2 RETURN count(r)")[0][0] == 0
+        assert run_query_return_single_value(
+            graph,
+            "MATCH (:Test)-[r:TEST]->(:Foo) RETURN [count(CASE WHEN $uuid IN r._source THEN 1 END), "
+            "count(CASE WHEN size(r._source) = 2 THEN 1 END), count(CASE WHEN size(r._source) <> 2 THEN 1 END)]",
+            uuid=small_relationshipset.uuid
+        ) == [100, 100, 0]
 
     def test_relationshipset_merge_no_labels(self, graph, create_nodes_test, small_relationshipset_no_labels):
 
         small_relationshipset_no_labels.merge(graph)
 
         # check if 100 relationships are created for two labels
-        result = run_query_return_results(graph, "MATCH (t:Test)-[r:TEST]->(f:Foo) RETURN count(r)")
+        result = run_query_return_single_value(graph, "MATCH (t:Test)-[r:TEST]->(f:Foo) RETURN count(r)")
 
-        assert result[0][0] == 100
+        assert result == 100
 
         # Test that 900 (3*3*100) relationships are created in total
-        result = run_query_return_results(graph, "MATCH (t)-[r:TEST]->(f) RETURN count(r)")
+        result = run_query_return_single_value(graph, "MATCH (t)-[r:TEST]->(f) RETURN count(r)")
 
-        assert result[0][0] == 900
+        assert result == 900
 
         # merge again to check that number stays the same
         small_relationshipset_no_labels.merge(graph)
 
         # check if 100 relationships are created for two labels
-        result = run_query_return_results(graph, "MATCH (t:Test)-[r:TEST]->(f:Foo) RETURN count(r)")
+        result = run_query_return_single_value(graph, "MATCH (t:Test)-[r:TEST]->(f:Foo) RETURN count(r)")
 
-        assert result[0][0] == 100
+        assert result == 100
 
         # Test that 900 (3*3*100) relationships are created in total
-        result = run_query_return_results(graph, "MATCH (t)-[r:TEST]->(f) RETURN count(r)")
+        result = run_query_return_single_value(graph, "MATCH (t)-[r:TEST]->(f) RETURN count(r)")
 
-        assert result[0][0] == 900
+        assert result == 900
 
 
-    def test_relationshipset_merge_array_props(self, graph, create_nodes_test):
+    @pytest.mark.parametrize('with_uuid', [False, True], ids=['array', 'string_and_array'])
+    def test_relationshipset_merge_array_props(self, graph, create_nodes_test, with_uuid):
 
         rs = RelationshipSet('TEST_ARRAY', ['Test'], ['Foo'], [ArrayProperty('array_key')], [ArrayProperty('array_key')])
 
         for i in range(100):
-            rs.add_relationship({'array_key': i}, {'array_key': i})
+            props = {'uuid': i, 'array_key': i} if with_uuid else {'array_key': i}
+            rs.add_relationship(props, props)
 
         rs.merge(graph)
 
-        result = run_query_return_results(graph, "MATCH (t:Test)-[r:TEST_ARRAY]->(f:Foo) RETURN count(r)")
+        result = run_query_return_single_value(graph, "MATCH (t:Test)-[r:TEST_ARRAY]->(f:Foo) RETURN count(r)")
 
-        assert result[0][0] == 100
+        assert result == 100
 
         # merge again
         rs.merge(graph)
 
-        result = run_query_return_results(graph, "MATCH (t:Test)-[r:TEST_ARRAY]->(f:Foo) RETURN count(r)")
-
-        assert result[0][0] == 100
+        result = run_query_return_single_value(graph, "MATCH (t:Test)-[r:TEST_ARRAY]->(f:Foo) RETURN count(r)")
 
-    def test_relationshipset_merge_string_and_array_props(self, graph, create_nodes_test):
-
-        rs = RelationshipSet('TEST_ARRAY', ['Test'], ['Foo'], [ArrayProperty('array_key')], [ArrayProperty('array_key')])
-
-        for i in range(100):
-            rs.add_relationship({'uuid': i, 'array_key': i}, {'uuid': i, 'array_key': i})
-
-        rs.merge(graph)
-
-        result = run_query_return_results(graph, "MATCH (t:Test)-[r:TEST_ARRAY]->(f:Foo) RETURN count(r)")
-
-        assert result[0][0] == 100
-
-        # run again
-        rs.merge(graph)
-
-        result = run_query_return_results(graph, "MATCH (t:Test)-[r:TEST_ARRAY]->(f:Foo) RETURN count(r)")
-
-        assert result[0][0] == 100
+        assert result == 100
 
 class TestRelationshipSetToJSON:
 
@@ -479,7 +456,7 @@ class TestRelationshipSetToCSV:
             assert len(lines) - 1 == len(rs.relationships)
 
             header = lines[0].strip().split(',')
-            assert set(header) == set([f"rel_{x}" for x in rs.all_property_keys()]).union(set([f"start_{x}" for x in rs.fixed_order_start_node_properties])).union(set([f"end_{x}" for x in rs.fixed_order_end_node_properties]))
+            assert set(header) == {f"rel_{x}" for x in rs.all_property_keys()}.union({f"start_{x}" for x in rs.fixed_order_start_node_properties}).union({f"end_{x}" for x in rs.fixed_order_end_node_properties})
 
     def test_create_csv_query(self):
         rs = RelationshipSet('TEST', ['Test', 'Other'], ['Foo', 'SomeLabel'], ['uuid', 'numerical'], ['uuid', 'value'])
@@ -521,7 +498,7 @@ class TestRelationshipSetCSVandJSON:
 
         ns = NodeSet.from_csv_json_set(nodes_csv_file_path, nodes_json_file_path)
         ns.merge(graph)
-        assert run_query_return_results(graph, "MATCH (n:Test) RETURN count(n)")[0][0] == 2
+        assert run_query_return_single_value(graph, "MATCH (n:Test) RETURN count(n)") == 2
 
         # create relset and load relationships
         json_file_path = os.path.join(files_path, 'rels_csv_json.json')
@@ -540,7 +517,7 @@ class TestRelationshipSetCSVandJSON:
 
         rs.merge(graph)
 
-        assert run_query_return_results(graph, "MATCH (:Test)-[r:RELATIONSHIP]->(:Test) RETURN count(r)")[0][0] == 1
+        assert run_query_return_single_value(graph, "MATCH (:Test)-[r:RELATIONSHIP]->(:Test) RETURN count(r)") == 1
 
     def test_read_from_files_load_items_to_memory(self, root_dir, clear_graph, graph):
 
@@ -552,7 +529,7 @@ class TestRelationshipSetCSVandJSON:
 
         ns = NodeSet.from_csv_json_set(nodes_csv_file_path, nodes_json_file_path, load_items=True)
         ns.merge(graph)
-        assert run_query_return_results(graph, "MATCH (n:Test) RETURN count(n)")[0][0] == 2
+        assert run_query_return_single_value(graph, "MATCH (n:Test) RETURN count(n)") == 2
 
         # create relset and load relationships
         json_file_path = os.path.join(files_path, 'rels_csv_json.json')
@@ -571,7 +548,7 @@ class TestRelationshipSetCSVandJSON:
 
         rs.merge(graph)
 
-        assert run_query_return_results(graph, "MATCH (:Test)-[r:RELATIONSHIP]->(:Test) RETURN count(r)")[0][0] == 1
+        assert run_query_return_single_value(graph, "MATCH (:Test)-[r:RELATIONSHIP]->(:Test) RETURN count(r)") == 1
 
     def test_read_from_files_custom_json_keys_load_items_to_memory(self, root_dir, clear_graph, graph):
 
@@ -583,7 +560,7 @@ class TestRelationshipSetCSVandJSON:
 
         ns = NodeSet.from_csv_json_set(nodes_csv_file_path, nodes_json_file_path, load_items=True)
         ns.merge(graph)
-        assert run_query_return_results(graph, "MATCH (n:Test) RETURN count(n)")[0][0] == 2
+        assert run_query_return_single_value(graph, "MATCH (n:Test) RETURN count(n)") == 2
 
         # create relset and load relationships
         json_file_path = os.path.join(files_path, 'custom_keys_rel_csv_json.json')
@@ -605,10 +582,10 @@ class TestRelationshipSetCSVandJSON:
 
         rs.merge(graph)
 
-        assert run_query_return_results(graph, "MATCH (:Test)-[r:RELATIONSHIP]->(:Test) RETURN count(r)")[0][0] == 1
+        assert run_query_return_single_value(graph, "MATCH (:Test)-[r:RELATIONSHIP]->(:Test) RETURN count(r)") == 1
 
 
-    def test_write_files_read_again_load_items_into_memory(self, graph, clear_graph, create_nodes_test, tmp_path, small_relationshipset):
+    def test_write_files_read_again_load_items_into_memory(self, tmp_path, small_relationshipset):
         csv_file_path = os.path.join(tmp_path, 'rels.csv')
         json_file_path = os.path.join(tmp_path, 'rels.json')
 
@@ -626,8 +603,4 @@ class TestRelationshipSetCSVandJSON:
         assert rs.start_node_properties == small_relationshipset.start_node_properties
         assert rs.end_node_properties == small_relationshipset.end_node_properties
         assert rs.rel_type == small_relationshipset.rel_type
-        assert len(rs.relationships) == 100
-
-        result = run_query_return_results(graph, "MATCH (t:Test)-[r:TEST]->(f:Foo) RETURN count(r)")
-
-        #assert result[0][0] == 100
\ No newline at end of file
+        assert len(rs.relationships) == 100
\ No newline at end of file
@@ -1,5 +1,7 @@
+import pytest
+
 from graphio.objects.unstructured_nodeset import UnstructuredNodeSet, Node
-from graphio.graph import run_query_return_results
+from graphio.graph import run_query_return_single_value
 
 
 class TestUnstructuredNodeSet:
@@ -25,20 +27,12 @@ class TestUnstructuredNodeSetIndexes:
 
         uns.create_index(graph)
 
-        # TODO keep until 4.2 is not supported anymore
-        try:
-            result = run_query_return_results(graph, "SHOW INDEXES YIELD *")
-        except:
-            result = run_query_return_results(graph, "CALL db.indexes()")
-
-        for row in result:
-            if 'tokenNames' in row:
-                assert row['tokenNames'] == labels and row['properties'] == properties \
-                       or row['tokenNames'] == labels and row['properties'] == properties
-
-            elif 'labelsOrTypes' in row:
-                assert row['labelsOrTypes'] == labels and row['properties'] == properties \
-                       or row['labelsOrTypes'] == labels and row['properties'] == properties
+        assert run_query_return_single_value(
+            graph,
+            "SHOW INDEXES YIELD labelsOrTypes, properties WHERE labelsOrTypes = $labels AND properties = $properties "
+            "RETURN count(*)",
+            labels=labels, properties=properties
+        ) == 1
 
     def test_create_composite_indexes(self, graph, clear_graph):
         labels = ["A"]
@@ -48,105 +42,99 @@ class TestUnstructuredNodeSetIndexes:
 
         uns.create_index(graph)
 
-        # TODO keep until 4.2 is not supported anymore
-        try:
-            result = run_query_return_results(graph, "SHOW INDEXES YIELD *")
-        except:
-            result = run_query_return_results(graph, "CALL db.indexes()")
-
-        for row in result:
-            if 'tokenNames' in row:
-                assert row['tokenNames'] == labels and row['properties'] == properties \
-                       or row['tokenNames'] == labels and row['properties'] == properties
-
-            elif 'labelsOrTypes' in row:
-                assert row['labelsOrTypes'] == labels and row['properties'] == properties \
-                       or row['labelsOrTypes'] == labels and row['properties'] == properties
+        assert run_query_return_single_value(
+            graph,
+            "SHOW INDEXES YIELD labelsOrTypes, properties WHERE labelsOrTypes = $labels AND properties = $properties "
+            "RETURN count(*)",
+            labels=labels, properties=properties
+        ) == 1
 
 
 class TestUnstructuredNodeSetCreate:
-    def test_unstructured_nodeset_create(self, graph, clear_graph):
+    @pytest.mark.parametrize('dynamic', [False, True])
+    def test_unstructured_nodeset_create(self, graph, clear_graph, dynamic):
         uns = UnstructuredNodeSet()
         uns.add_node(Node(labels=["A"], merge_keys=["a"], properties={"a": 1}))
         uns.add_node(Node(labels=["A"], merge_keys=["b"], properties={"b": 2}))
         uns.add_node(Node(labels=["B", "C"], merge_keys=["a"], properties={"a": 3}))
         uns.add_node(Node(labels=["B"], merge_keys=["b", "c"], properties={"b": 4, "c": 5}))
 
-        uns.create(graph)
+        uns.create(graph, dynamic=dynamic)
 
-        result = run_query_return_results(graph, "MATCH (n) RETURN n, labels(n) AS labels")
+        result = run_query_return_single_value(graph, "MATCH (n) RETURN collect([labels(n), properties(n)])")
 
         assert len(result) == 4
-        for row in result:
-            if 'a' in row['n']:
-                if row['n']['a'] == 1:
-                    assert row['labels'] == ['A']
-            elif 'b' in row['n']:
-                if row['n']['b'] == 2:
-                    assert row['labels'] == ['A']
-                elif row['n']['b'] == 4:
-                    assert row['labels'] == ['B']
-                    assert row['n']['c'] == 5
-            elif 'c' in row['n']:
-                assert row['n']['c'] == 5
-                assert row['labels'] == ['B']
-
-    def test_unstructured_nodeset_additional_labels_create(self, graph, clear_graph):
+        assert {(frozenset(labels), frozenset(properties.items())) for labels, properties in result} == {
+            (frozenset(['A']), frozenset({'a': 1}.items())),
+            (frozenset(['A']), frozenset({'b': 2}.items())),
+            (frozenset(['B', 'C']), frozenset({'a': 3}.items())),
+            (frozenset(['B']), frozenset({'b': 4, 'c': 5}.items())),
+        }
+
+    @pytest.mark.parametrize('dynamic', [False, True])
+    def test_unstructured_nodeset_additional_labels_create(self, graph, clear_graph, dynamic):
         uns = UnstructuredNodeSet()
         uns.add_node(Node(labels=["A"], merge_keys=["a"], properties={"a": 1}, additional_labels=["B", "C"]))
 
-        uns.create(graph)
+        uns.create(graph, dynamic=dynamic)
 
         q = "MATCH (n:A:B:C) RETURN count(n)"
-        result = run_query_return_results(graph, q)
-        assert result[0][0] == 1
+        result = run_query_return_single_value(graph, q)
+        assert result == 1
 
 
 class TestUnstructuredNodeSetMerge:
-    def test_unstructured_nodeset_merge(self, graph, clear_graph):
+    @pytest.mark.parametrize('dynamic', [False, True])
+    def test_unstructured_nodeset_merge(self, graph, clear_graph, dynamic):
         uns = UnstructuredNodeSet()
         uns.add_node(Node(labels=["A"], merge_keys=["a"], properties={"a": 1}))
         uns.add_node(Node(labels=["A"], merge_keys=["b"], properties={"b": 2}))
         uns.add_node(Node(labels=["B", "C"], merge_keys=["a"], properties={"a": 3}))
         uns.add_node(Node(labels=["B"], merge_keys=["b", "c"], properties={"b": 4, "c": 5}))
 
-        uns.merge(graph)
-        uns.merge(graph)
-        uns.merge(graph)
+        uns.merge(graph, dynamic=dynamic)
+        # merge again to check that the nodes are not duplicated
+        uns.merge(graph, dynamic=dynamic)
 
-        result = run_query_return_results(graph, "MATCH (n) RETURN n, labels(n) AS labels")
+        result = run_query_return_single_value(graph, "MATCH (n) RETURN collect([labels(n), properties(n)])")
 
         assert len(result) == 4
-
-        for row in result:
-            if 'a' in row['n']:
-                if row['n']['a'] == 1:
-                    assert row['labels'] == ['A']
-            elif 'b' in row['n']:
-                if row['n']['b'] == 2:
-                    assert row['labels'] == ['A']
-                elif row['n']['b'] == 4:
-                    assert row['labels'] == ['B']
-                    assert row['n']['c'] == 5
-            elif 'c' in row['n']:
-                assert row['n']['c'] == 5
-                assert row['labels'] == ['B']
-
-    def test_unstructured_nodeset_merge_additional_labels(self, graph, clear_graph):
+        assert {(frozenset(labels), frozenset(properties.items())) for labels, properties in result} == {
+            (frozenset(['A']), frozenset({'a': 1}.items())),
+            (frozenset(['A']), frozenset({'b': 2}.items())),
+            (frozenset(['B', 'C']), frozenset({'a': 3}.items())),
+            (frozenset(['B']), frozenset({'b': 4, 'c': 5}.items())),
+        }
+
+    @pytest.mark.parametrize('dynamic', [False, True])
+    def test_unstructured_nodeset_merge_additional_labels(self, graph, clear_graph, dynamic):
         uns1 = UnstructuredNodeSet()
         uns1.add_node(Node(labels=["A"], merge_keys=["a"], properties={"a": 1}, additional_labels=["B", "C"]))
 
         uns2 = UnstructuredNodeSet()
         uns2.add_node(Node(labels=["A"], merge_keys=["a"], properties={"a": 1}, additional_labels=["D", "E"]))
 
-        uns1.merge(graph)
-        uns2.merge(graph)
+        uns1.merge(graph, dynamic=dynamic)
+        uns2.merge(graph, dynamic=dynamic)
+
+        result = run_query_return_single_value(graph, "MATCH (n:A) RETURN count(n)")
+        assert result == 1
+
+        result = run_query_return_single_value(graph, "MATCH (n:A:B:C:D:E) RETURN count(n)")
+        assert result == 1
+
+    @pytest.mark.parametrize('dynamic', [False, True])
+    def test_unstructured_nodeset_merge_without_merge_keys(self, graph, clear_graph, dynamic):
+        uns = UnstructuredNodeSet()
+        uns.add_node(Node(labels=["A"], merge_keys=[]))
+        uns.add_node(Node(labels=["B"], merge_keys=["b"], properties={"b": 1}))
 
-        result = run_query_return_results(graph, "MATCH (n:A) RETURN count(n)")
-        assert result[0][0] == 1
+        uns.merge(graph, dynamic=dynamic)
+        uns.merge(graph, dynamic=dynamic)
 
-        result = run_query_return_results(graph, "MATCH (n:A:B:C:D:E) RETURN count(n)")
-        assert result[0][0] == 1
+        assert run_query_return_single_value(
+            graph, "RETURN [COUNT { (:A) }, COUNT { (:B) }]"
+        ) == [1, 1]
 
 class TestUnstructuredNodeSetReturnNodeset:
     def test_unstructured_nodeset_return_nodeset(self):
@@ -172,5 +160,5 @@ class TestUnstructuredNodeSetReturnNodeset:
         assert len(nodesets) == 3
 
         assert ["A"] in [ns.labels for ns in nodesets]
-        assert any([ns.additional_labels == ["B"] for ns in nodesets])
-        assert any([ns.additional_labels == ["C"] for ns in nodesets])
\ No newline at end of file
+        assert any(ns.additional_labels == ["B"] for ns in nodesets)
+        assert any(ns.additional_labels == ["C"] for ns in nodesets)
\ No newline at end of file
@@ -2,7 +2,7 @@ from graphio.objects.unstructured_relationshipset import UnstructuredRelationshi
 from graphio.objects.unstructured_nodeset import UnstructuredNodeSet, Node
 from graphio.objects.nodeset import NodeSet
 from graphio.objects.relationshipset import RelationshipSet
-from graphio.graph import run_query_return_results
+from graphio.graph import run_query_return_single_value
 
 
 def test_unstructred_relationship_unique_node_definitions():
@@ -17,6 +17,25 @@ def test_unstructred_relationship_unique_node_definitions():
     assert urs.unique_node_definitions == {(('D',), ('d',)), (('B',), ('b',)), (('C',), ('c',)), (('A',), ('a',))}
 
 
+def test_unstructured_relationship_group_relationships():
+    rels = [
+        Relationship(start_node=NodeMatch(labels=["A"], properties={"a": 1}),
+                     end_node=NodeMatch(labels=["B"], properties={"b": 2}), type="REL", properties={"c": 3}),
+        Relationship(start_node=NodeMatch(labels=["A"], properties={"a": 2}),
+                     end_node=NodeMatch(labels=["B"], properties={"b": 3}), type="REL", properties={"c": 4}),
+        Relationship(start_node=NodeMatch(labels=["C"], properties={"c": 1}),
+                     end_node=NodeMatch(labels=["D"], properties={"d": 2}), type="REL")
+    ]
+
+    grouped = UnstructuredRelationshipSet.group_relationships(rels)
+
+    assert grouped == {
+        ("REL", ("A",), ("B",), ("a",), ("b",)): {'rels': [{'start_a': 1, 'end_b': 2, 'properties': {'c': 3}},
+                                                          {'start_a': 2, 'end_b': 3, 'properties': {'c': 4}}]},
+        ("REL", ("C",), ("D",), ("c",), ("d",)): {'rels': [{'start_c': 1, 'end_d': 2, 'properties': {}}]}
+    }
+
+
 class TestUnstructuredRelationshipSetIndexes:
 
     def test_create_single_indexes(self, graph, clear_graph):
@@ -29,20 +48,12 @@ class TestUnstructuredRelationshipSetIndexes:
 
         urs.create_index(graph)
 
-        # TODO keep until 4.2 is not supported anymore
-        try:
-            result = run_query_return_results(graph, "SHOW INDEXES YIELD *")
-        except:
-            result = run_query_return_results(graph, "CALL db.indexes()")
-
-        for row in result:
-            if 'tokenNames' in row:
-                assert row['tokenNames'] == labels and row['properties'] == properties \
-                       or row['tokenNames'] == labels and row['properties'] == properties
-
-            elif 'labelsOrTypes' in row:
-                assert row['labelsOrTypes'] == labels and row['properties'] == properties \
-                       or row['labelsOrTypes'] == labels and row['properties'] == properties
+        assert run_query_return_single_value(
+            graph,
+            "SHOW INDEXES YIELD labelsOrTypes, properties WHERE labelsOrTypes = $labels AND properties = $properties "
+            "RETURN count(*)",
+            labels=labels, properties=properties
+        ) == 1
 
     def test_create_composite_indexes(self, graph, clear_graph):
         labels = ["A"]
@@ -54,20 +65,12 @@ class TestUnstructuredRelationshipSetIndexes:
 
         urs.create_index(graph)
 
-        # TODO keep until 4.2 is not supported anymore
-        try:
-            result = run_query_return_results(graph, "SHOW INDEXES YIELD *")
-        except:
-            result = run_query_return_results(graph, "CALL db.indexes()")
-
-        for row in result:
-            if 'tokenNames' in row:
-                assert row['tokenNames'] == labels and row['properties'] == properties \
-                       or row['tokenNames'] == labels and row['properties'] == properties
-
-            elif 'labelsOrTypes' in row:
-                assert row['labelsOrTypes'] == labels and row['properties'] == properties \
-                       or row['labelsOrTypes'] == labels and row['properties'] == properties
+        assert run_query_return_single_value(
+            graph,
+            "SHOW INDEXES YIELD labelsOrTypes, properties WHERE labelsOrTypes = $labels AND properties = $properties "
+            "RETURN count(*)",
+            labels=labels, properties=properties
+        ) == 1
 
 
 class TestUnstructuredRelationshipSetCreate:
@@ -92,15 +95,15 @@ class TestUnstructuredRelationshipSetCreate:
 
             urs.create(graph)
 
-            result = run_query_return_results(graph, "MATCH (n)-[r]->(m) RETURN n, r, m")
+            result = run_query_return_single_value(
+                graph, "MATCH (n)-[r]->(m) RETURN collect([properties(n), properties(r), properties(m)])"
+            )
 
             assert len(result) == 2
-            assert result[0]['n']['a'] == 1
-            assert result[0]['m']['b'] == 2
-            assert result[0]['r']['c'] == 3
-            assert result[1]['n']['c'] == 1
-            assert result[1]['m']['d'] == 2
-            assert result[1]['r']['c'] == 3
+            assert {tuple(frozenset(props.items()) for props in row) for row in result} == {
+                (frozenset({'a': 1}.items()), frozenset({'c': 3}.items()), frozenset({'b': 2}.items())),
+                (frozenset({'c': 1}.items()), frozenset({'c': 3}.items()), frozenset({'d': 2}.items())),
+            }
 
         def test_merge_relationships(self, graph, clear_graph):
 
@@ -122,17 +125,16 @@ class TestUnstructuredRelationshipSetCreate:
 
             urs.merge(graph)
             urs.merge(graph)
-            urs.merge(graph)
 
-            result = run_query_return_results(graph, "MATCH (n)-[r]->(m) RETURN n, r, m")
+            result = run_query_return_single_value(
+                graph, "MATCH (n)-[r]->(m) RETURN collect([properties(n), properties(r), properties(m)])"
+            )
 
             assert len(result) == 2
-            assert result[0]['n']['a'] == 1
-            assert result[0]['m']['b'] == 2
-            assert result[0]['r']['c'] == 3
-            assert result[1]['n']['c'] == 1
-            assert result[1]['m']['d'] == 2
-            assert result[1]['r']['c'] == 3
+            assert {tuple(frozenset(props.items()) for props in row) for row in result} == {
+                (frozenset({'a': 1}.items()), frozenset({'c': 3}.items()), frozenset({'b': 2}.items())),
+                (frozenset({'c': 1}.items()), frozenset({'c': 3}.items()), frozenset({'d': 2}.items())),
+            }
 
 
 class TestUnstructuredRelationshipSetReturnRelationshipSet:
@@ -147,6 +149,6 @@ class TestUnstructuredRelationshipSetReturnRelationshipSet:
 
         relationshipsets = uns.relationshipsets()
 
-        assert all([isinstance(rs, RelationshipSet) for rs in relationshipsets])
+        assert all(isinstance(rs, RelationshipSet) for rs in relationshipsets)
 
         assert "REL" in [rs.rel_type for rs in relationshipsets]
@@ -3,6 +3,13 @@ from uuid import UUID
 import pytest
 
 from graphio.objects.update import GraphUpdate, RelationshipSet, NodeSet
+from graphio.graph import run_query_return_single_value
+
+# uuid of the (single) GraphUpdate node, number of NodeSet/RelationshipSet nodes and number of
+# NodeSet/RelationshipSet nodes connected to the GraphUpdate, checked with one query
+GRAPH_UPDATE_STATE_QUERY = """MATCH (g:GraphUpdate)
+RETURN [g.uuid, COUNT { (:NodeSet) }, COUNT { (:RelationshipSet) },
+        COUNT { (g)-[:CONTAINS]->(:RelationshipSet) }, COUNT { (g)-[:CONTAINS]->(:NodeSet) }]"""
 
 
 @pytest.fixture
@@ -41,7 +48,7 @@ class TestGraphUpdate:
 
 class TestGraphUpdateCycle:
 
-    def test_graph_update(self, graph, clear_graph, small_relationshipset, matching_nodesets):
+    def test_graph_update(self, graph, clear_graph, test_indexes, small_relationshipset, matching_nodesets):
         ns1, ns2 = matching_nodesets
 
         graph_update = GraphUpdate()
@@ -58,14 +65,9 @@ class TestGraphUpdateCycle:
 
         graph_update.finish()
 
-        with graph.session() as s:
-            assert list(s.run("MATCH (n:GraphUpdate) RETURN n.uuid as uuid"))[0][0] == graph_update.uuid
-            assert list(s.run("MATCH (n:NodeSet) RETURN count(n)"))[0][0] == 2
-            assert list(s.run("MATCH (n:RelationshipSet) RETURN count(n)"))[0][0] == 1
-            assert list(s.run("MATCH (g:GraphUpdate)-[:CONTAINS]->(n:RelationshipSet) RETURN count(n)"))[0][0] == 1
-            assert list(s.run("MATCH (g:GraphUpdate)-[:CONTAINS]->(n:NodeSet) RETURN count(n)"))[0][0] == 2
+        assert run_query_return_single_value(graph, GRAPH_UPDATE_STATE_QUERY) == [graph_update.uuid, 2, 1, 1, 2]
 
-    def test_graph_update_mixed_add(self, graph, clear_graph, small_relationshipset, matching_nodesets):
+    def test_graph_update_mixed_add(self, graph, clear_graph, test_indexes, small_relationshipset, matching_nodesets):
         ns1, ns2 = matching_nodesets
 
         graph_update = GraphUpdate()
@@ -75,9 +77,4 @@ class TestGraphUpdateCycle:
 
         graph_update.finish()
 
-        with graph.session() as s:
-            assert list(s.run("MATCH (n:GraphUpdate) RETURN n.uuid as uuid"))[0][0] == graph_update.uuid
-            assert list(s.run("MATCH (n:NodeSet) RETURN count(n)"))[0][0] == 2
-            assert list(s.run("MATCH (n:RelationshipSet) RETURN count(n)"))[0][0] == 1
-            assert list(s.run("MATCH (g:GraphUpdate)-[:CONTAINS]->(n:RelationshipSet) RETURN count(n)"))[0][0] == 1
-            assert list(s.run("MATCH (g:GraphUpdate)-[:CONTAINS]->(n:NodeSet) RETURN count(n)"))[0][0] == 2
+        assert run_query_return_single_value(graph, GRAPH_UPDATE_STATE_QUERY) == [graph_update.uuid, 2, 1, 1, 2]
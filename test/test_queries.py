@@ -1,6 +1,7 @@
 from graphio.queries import rels_create_factory, rels_merge_factory, CypherQuery, get_label_string_from_list_of_labels, \
     match_clause_with_properties, merge_clause_with_properties, match_properties_as_string, nodes_merge_factory, \
-    nodes_create_factory
+    nodes_create_factory, rels_match_clauses, nodes_exists_factory, rels_params_from_objects, \
+    nodes_create_dynamic_labels_factory, nodes_merge_dynamic_labels_factory
 
 
 def test_match_clause_with_properties():
@@ -70,6 +71,11 @@ MERGE (n:Person { name: properties.name } )
 ON CREATE SET n = properties
 ON MATCH SET n += properties"""
 
+    def test_nodes_merge_factory_without_set(self):
+        q = nodes_merge_factory(['Person'], ['name'], with_set=False)
+        assert q == """UNWIND $props AS properties
+MERGE (n:Person { name: properties.name } )"""
+
     def test_nodes_merge_factory_preserve(self):
         q = nodes_merge_factory(['Person'], ['name'], preserve=['foo'])
         assert q == """UNWIND $props AS properties
@@ -107,6 +113,46 @@ ON CREATE SET n._source = [$source]
 ON MATCH SET n._source = n._source + [$source]"""
 
 
+def test_nodes_create_dynamic_labels_factory():
+    assert nodes_create_dynamic_labels_factory() == """UNWIND $nodes AS row
+CALL apoc.create.node(row.labels, row.properties) YIELD node
+RETURN count(node)"""
+
+
+def test_nodes_merge_dynamic_labels_factory():
+    assert nodes_merge_dynamic_labels_factory() == """UNWIND $nodes AS row
+CALL apoc.merge.node(row.labels, row.merge_properties) YIELD node
+SET node = row.properties
+WITH node, row
+CALL apoc.create.addLabels(node, row.additional_labels) YIELD node AS n
+RETURN count(n)"""
+
+
+def test_nodes_exists_factory():
+    assert nodes_exists_factory(['Person'], ['name', 'age']) == """UNWIND range(0, size($rows) - 1) AS i
+WITH i, $rows[i] AS r
+OPTIONAL MATCH (n:Person { name: r.name, age: r.age } )
+RETURN i, count(n) AS c"""
+
+
+def test_rels_match_clauses():
+    assert rels_match_clauses(['Person'], ['Movie'], ['name'], ['title']) == [
+        'MATCH (a:Person), (b:Movie)',
+        'WHERE a.name = rel.start_name AND b.title = rel.end_title'
+    ]
+
+
+def test_rels_params_from_objects():
+    rels = [({'name': 'Alice'}, {'title': 'Matrix', 'year': 1999}, {'rating': 5}),
+            ({'name': 'Bob'}, {'title': 'Alien', 'year': 1979}, {})]
+
+    assert rels_params_from_objects(rels) == {'rels': [
+        {'start_name': 'Alice', 'end_title': 'Matrix', 'end_year': 1999, 'properties': {'rating': 5}},
+        {'start_name': 'Bob', 'end_title': 'Alien', 'end_year': 1979, 'properties': {}}
+    ]}
+    assert list(rels_params_from_objects(rels, property_identifier='foo')) == ['foo']
+
+
 class TestRelationshipsCreateFactory:
 
     def test_rels_create(self):